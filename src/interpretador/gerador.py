@@ -0,0 +1,317 @@
+# gerador.py
+
+# Gerador de programas Assembly aleatórios (válidos e com término garantido) para testes de
+# vazão do simulador e para alimentar a co-simulação diferencial (fuzzing).
+
+import math
+import random
+from typing import Dict, Optional
+
+from .interpretador import INSTRUCOES, montar_instrucao
+
+# ------------------------------
+# Convenções de Registradores dos Programas Gerados
+# ------------------------------
+# r0       -> sempre 0 (nunca é escrito)
+# r1..r15  -> dados (destino e origem das operações aleatórias)
+# r16..r18 -> contadores dos laços aninhados (um por nível)
+# r19      -> contador do laço externo usado para atingir `alvo_instrucoes`
+# r20      -> máscara do footprint de memória (potência de 2 - 1)
+# r21      -> endereço base da área de dados
+# r22      -> endereço temporário de load/store
+# r23      -> ponteiro da pilha (salva r31 nas chamadas aninhadas)
+# r31      -> endereço de retorno (JAL)
+#
+# Como só os contadores escrevem em r16..r19, e apenas com DEC, todo laço termina.
+# Funções só chamam funções de nível mais profundo, então não há recursão.
+
+REGS_DADOS = list(range(1, 16))
+REG_CONTADORES = [16, 17, 18]
+REG_EXTERNO = 19
+REG_MASCARA, REG_BASE, REG_ENDERECO, REG_PILHA = 20, 21, 22, 23
+
+BASE_DADOS = 0x8000
+BASE_PILHA = 0x7000
+
+# Desvios condicionais só alcançam endereços de 8 bits (campo RC)
+LIMITE_DESVIO = 256
+
+# Categorias do mix de instruções, montadas a partir da tabela INSTRUCOES
+CATEGORIAS = {
+    'alu': ["add", "sub", "xor", "or", "and", "not", "passa", "zeros", "neg", "inc", "dec"],
+    'shift': ["asl", "asr", "lsl", "lsr"],
+    'muldiv': ["mul", "div", "mod"],
+    'constante': ["lcl_msb", "lcl_lsb"],
+    'memoria': ["load", "store"],
+    'desvio': ["beq", "bne", "bgt", "blt"],
+    'chamada': ["jal"],
+}
+assert all(m in INSTRUCOES for ms in CATEGORIAS.values() for m in ms)
+
+MIX_PADRAO = {'alu': 40, 'shift': 10, 'muldiv': 5, 'constante': 10, 'memoria': 20, 'desvio': 10, 'chamada': 5}
+
+UNARIAS = {"not", "passa", "neg", "inc", "dec"}
+
+
+class _Rotulo:
+    """Endereço simbólico, resolvido na montagem do texto final."""
+
+    def __init__(self, nome):
+        self.nome = nome
+        self.endereco = None
+
+
+class ProgramaGerado:
+    def __init__(self, texto, semente, instrucoes_estaticas, instrucoes_dinamicas_max):
+        self.texto = texto                                      # Código Assembly pronto para o montador
+        self.semente = semente
+        self.instrucoes_estaticas = instrucoes_estaticas
+        self.instrucoes_dinamicas_max = instrucoes_dinamicas_max  # Limite superior (desvios podem pular código)
+
+    def salvar(self, caminho_asm: str) -> None:
+        with open(caminho_asm, "w") as f:
+            f.write(self.texto)
+
+
+class GeradorProgramas:
+    def __init__(self, semente: Optional[int] = None, mix: Optional[Dict[str, int]] = None,
+                 tamanho_bloco: int = 12, profundidade_lacos: int = 2, iteracoes=(2, 8),
+                 footprint: int = 256, profundidade_chamadas: int = 2, tamanho_funcao: int = 8,
+                 alvo_instrucoes: Optional[int] = None):
+        """
+        :param semente: Semente do gerador pseudoaleatório (mesma semente -> mesmo programa)
+        :param mix: Pesos por categoria (ver CATEGORIAS); categorias ausentes têm peso 0
+        :param tamanho_bloco: Operações aleatórias por bloco (corpo de laço ou programa principal)
+        :param profundidade_lacos: Níveis máximos de laços aninhados (0 a 3)
+        :param iteracoes: Faixa (mín, máx) de iterações de cada laço
+        :param footprint: Palavras de dados acessadas por load/store (potência de 2, até 16384)
+        :param profundidade_chamadas: Níveis de funções aninhadas via JAL (0 desliga chamadas)
+        :param tamanho_funcao: Operações aleatórias no corpo de cada função
+        :param alvo_instrucoes: Se definido, envolve o programa em um laço externo até chegar
+                                a aproximadamente esse número de instruções dinâmicas
+        """
+        if not 0 <= profundidade_lacos <= len(REG_CONTADORES):
+            raise ValueError(f"Profundidade de laços deve estar entre 0 e {len(REG_CONTADORES)}")
+        if footprint < 1 or footprint & (footprint - 1) or footprint > 0x4000:
+            raise ValueError("Footprint deve ser uma potência de 2 entre 1 e 16384")
+        if iteracoes[0] < 1 or iteracoes[1] < iteracoes[0]:
+            raise ValueError("Faixa de iterações inválida")
+        self.semente = semente if semente is not None else random.randrange(2 ** 32)
+        self.mix = dict(MIX_PADRAO if mix is None else mix)
+        desconhecidas = set(self.mix) - set(CATEGORIAS)
+        if desconhecidas:
+            raise ValueError(f"Categorias desconhecidas no mix: {sorted(desconhecidas)}")
+        self.tamanho_bloco = tamanho_bloco
+        self.profundidade_lacos = profundidade_lacos
+        self.iteracoes = iteracoes
+        self.footprint = footprint
+        self.profundidade_chamadas = profundidade_chamadas
+        self.tamanho_funcao = tamanho_funcao
+        self.alvo_instrucoes = alvo_instrucoes
+
+    # ------------------------------
+    # Emissão de Código
+    # ------------------------------
+    # Cada emissor acrescenta itens em `saida` e retorna o custo dinâmico máximo do trecho
+    # (_operacao_simples: instruções; os demais: (instruções, desvios condicionais executados),
+    # pois com trampolins cada desvio condicional executado custa um `j` a mais).
+    # Itens: (mnemônico, [operandos]) ou _Rotulo; operandos podem ser _Rotulo (alvos).
+
+    def _escolher_categoria(self, permitir_chamada, permitir_desvio=True):
+        categorias = [c for c, peso in self.mix.items() if peso > 0
+                      and (permitir_chamada or c != 'chamada') and (permitir_desvio or c != 'desvio')]
+        if not categorias:
+            return 'alu'
+        return self._rng.choices(categorias, weights=[self.mix[c] for c in categorias])[0]
+
+    def _reg(self, com_zero=False):
+        return self._rng.choice(([0] if com_zero else []) + REGS_DADOS)
+
+    def _operacao_simples(self, saida, categoria):
+        rng = self._rng
+        if categoria == 'constante':
+            rd = self._reg()
+            if rng.random() < 0.5:
+                saida.append(("lcl_msb", [f"r{rd}", str(rng.randrange(0x10000))]))
+                saida.append(("lcl_lsb", [f"r{rd}", str(rng.randrange(0x10000))]))
+                return 2
+            saida.append((rng.choice(CATEGORIAS['constante']), [f"r{rd}", str(rng.randrange(0x10000))]))
+            return 1
+        if categoria == 'memoria':
+            # Endereço = base + (registrador & máscara): sempre dentro da área de dados
+            saida.append(("and", [f"r{REG_ENDERECO}", f"r{self._reg(True)}", f"r{REG_MASCARA}"]))
+            saida.append(("add", [f"r{REG_ENDERECO}", f"r{REG_ENDERECO}", f"r{REG_BASE}"]))
+            if rng.random() < 0.5:
+                saida.append(("load", [f"r{self._reg()}", f"r{REG_ENDERECO}"]))
+            else:
+                saida.append(("store", [f"r{REG_ENDERECO}", f"r{self._reg(True)}"]))
+            return 3
+
+        mnemonico = rng.choice(CATEGORIAS[categoria])     # 'alu', 'shift' ou 'muldiv'
+        if mnemonico == "zeros":
+            saida.append((mnemonico, [f"r{self._reg()}"]))
+        elif mnemonico in UNARIAS:
+            saida.append((mnemonico, [f"r{self._reg()}", f"r{self._reg(True)}"]))
+        else:
+            saida.append((mnemonico, [f"r{self._reg()}", f"r{self._reg(True)}", f"r{self._reg(True)}"]))
+        return 1
+
+    def _operacao(self, saida, nivel_chamada):
+        permitir_chamada = nivel_chamada < self.profundidade_chamadas
+        categoria = self._escolher_categoria(permitir_chamada)
+
+        if categoria == 'desvio':
+            # Desvio para frente sobre 1..3 operações simples (if sem else)
+            destino = self._novo_rotulo("pula")
+            saida.append((self._rng.choice(CATEGORIAS['desvio']),
+                          [f"r{self._reg(True)}", f"r{self._reg(True)}", destino]))
+            custo = 1
+            for _ in range(self._rng.randint(1, 3)):
+                custo += self._operacao_simples(saida, self._escolher_categoria(False, False))
+            saida.append(destino)
+            return custo, 1
+
+        if categoria == 'chamada':
+            funcao = self._funcoes[nivel_chamada]
+            saida.append(("store", [f"r{REG_PILHA}", "r31"]))     # Empilha o retorno atual
+            saida.append(("inc", [f"r{REG_PILHA}", f"r{REG_PILHA}"]))
+            saida.append(("jal", [funcao['rotulo']]))
+            saida.append(("dec", [f"r{REG_PILHA}", f"r{REG_PILHA}"]))
+            saida.append(("load", ["r31", f"r{REG_PILHA}"]))       # Desempilha
+            return 5 + funcao['custo'], funcao['desvios']
+
+        return self._operacao_simples(saida, categoria), 0
+
+    def _bloco(self, saida, nivel_laco, nivel_chamada, tamanho):
+        custo = desvios = 0
+        for _ in range(tamanho):
+            if nivel_laco < self.profundidade_lacos and self._rng.random() < 0.15:
+                c, d = self._laco(saida, nivel_laco, nivel_chamada)
+            else:
+                c, d = self._operacao(saida, nivel_chamada)
+            custo += c
+            desvios += d
+        return custo, desvios
+
+    def _laco(self, saida, nivel_laco, nivel_chamada):
+        contador = REG_CONTADORES[nivel_laco]
+        iteracoes = self._rng.randint(*self.iteracoes)
+        inicio = self._novo_rotulo("laco")
+        saida.append(("lcl_msb", [f"r{contador}", str(iteracoes >> 16)]))
+        saida.append(("lcl_lsb", [f"r{contador}", str(iteracoes & 0xFFFF)]))
+        saida.append(inicio)
+        corpo, desvios = self._bloco(saida, nivel_laco + 1, nivel_chamada, max(1, self.tamanho_bloco // 2))
+        saida.append(("dec", [f"r{contador}", f"r{contador}"]))
+        saida.append(("bne", [f"r{contador}", "r0", inicio]))
+        return 2 + iteracoes * (corpo + 2), iteracoes * (desvios + 1)
+
+    def _novo_rotulo(self, prefixo):
+        self._contador_rotulos += 1
+        return _Rotulo(f"{prefixo}_{self._contador_rotulos}")
+
+    # ------------------------------
+    # Geração do Programa
+    # ------------------------------
+    def gerar(self) -> ProgramaGerado:
+        self._rng = random.Random(self.semente)
+        self._contador_rotulos = 0
+
+        # Funções: a do nível mais profundo é gerada primeiro, pois as demais a chamam
+        self._funcoes = [None] * self.profundidade_chamadas
+        codigo_funcoes = []
+        for nivel in reversed(range(self.profundidade_chamadas)):
+            rotulo = self._novo_rotulo("funcao")
+            corpo = [rotulo]
+            custo, desvios = self._bloco(corpo, len(REG_CONTADORES), nivel + 1, self.tamanho_funcao)
+            corpo.append(("jr", ["r31"]))
+            self._funcoes[nivel] = {'rotulo': rotulo, 'custo': custo + 1, 'desvios': desvios}
+            codigo_funcoes = corpo + codigo_funcoes
+
+        # Programa principal: inicialização + corpo (opcionalmente repetido por um laço externo)
+        principal = []
+        custo_init = 0
+        for reg in REGS_DADOS:
+            principal.append(("lcl_lsb", [f"r{reg}", str(self._rng.randrange(0x10000))]))
+            custo_init += 1
+        for reg, valor in ((REG_MASCARA, self.footprint - 1), (REG_BASE, BASE_DADOS), (REG_PILHA, BASE_PILHA)):
+            principal.append(("lcl_msb", [f"r{reg}", "0"]))
+            principal.append(("lcl_lsb", [f"r{reg}", str(valor)]))
+            custo_init += 2
+
+        corpo = []
+        custo_corpo, desvios = self._bloco(corpo, 0, 0, self.tamanho_bloco)
+        if self.alvo_instrucoes:
+            repeticoes = max(1, math.ceil((self.alvo_instrucoes - custo_init) / (custo_corpo + 2)))
+            repeticoes = min(repeticoes, 0xFFFFFFFF)
+            inicio = self._novo_rotulo("externo")
+            principal += [("lcl_msb", [f"r{REG_EXTERNO}", str(repeticoes >> 16)]),
+                          ("lcl_lsb", [f"r{REG_EXTERNO}", str(repeticoes & 0xFFFF)]), inicio]
+            principal += corpo
+            principal += [("dec", [f"r{REG_EXTERNO}", f"r{REG_EXTERNO}"]),
+                          ("bne", [f"r{REG_EXTERNO}", "r0", inicio])]
+            custo_corpo = 2 + repeticoes * (custo_corpo + 2)
+            desvios = repeticoes * (desvios + 1)
+        else:
+            principal += corpo
+        principal.append(("halt", []))
+
+        itens = principal + codigo_funcoes
+        texto, estaticas, usar_trampolins = self._montar_texto(itens)
+        dinamicas = custo_init + custo_corpo + 1
+        if usar_trampolins:
+            dinamicas += 1 + desvios    # `j` inicial + um `j` por desvio condicional executado
+        return ProgramaGerado(texto, self.semente, estaticas, dinamicas)
+
+    def _montar_texto(self, itens):
+        """Resolve os rótulos (com trampolins quando necessário); retorna (texto, estáticas, usou trampolins)."""
+        instrucoes = [i for i in itens if not isinstance(i, _Rotulo)]
+        desvios = [i for i in instrucoes if i[0] in CATEGORIAS['desvio']]
+
+        # Desvios condicionais só alcançam 8 bits: se o código não couber abaixo de 256,
+        # cada desvio vai para um trampolim ("j alvo") no início da memória.
+        usar_trampolins = len(instrucoes) > LIMITE_DESVIO
+        if usar_trampolins and len(desvios) + 1 > LIMITE_DESVIO:
+            raise ValueError("Programa com desvios demais para a área de trampolins (reduza o tamanho)")
+
+        endereco = 1 + len(desvios) if usar_trampolins else 0
+        for item in itens:
+            if isinstance(item, _Rotulo):
+                item.endereco = endereco
+            else:
+                endereco += 1
+
+        linhas = [f"; Programa gerado aleatoriamente (semente {self.semente})"]
+        trampolins = []
+        if usar_trampolins:
+            linhas.append(f"j {1 + len(desvios)}        ; pula a área de trampolins")
+
+        for item in itens:
+            if isinstance(item, _Rotulo):
+                linhas.append(f"; {item.nome}:  (endereço {item.endereco})")
+                continue
+            mnemonico, operandos = item
+            textos = []
+            for op in operandos:
+                if isinstance(op, _Rotulo):
+                    alvo = op.endereco
+                    if usar_trampolins and mnemonico in CATEGORIAS['desvio']:
+                        trampolins.append(f"j {alvo}")
+                        alvo = len(trampolins)
+                    textos.append(str(alvo))
+                else:
+                    textos.append(op)
+            linhas.append(f"{mnemonico} {', '.join(textos)}".strip())
+
+        if usar_trampolins:
+            linhas[2:2] = trampolins
+
+        # Confere que tudo é montável (falha cedo, com a linha problemática)
+        for linha in linhas:
+            montar_instrucao(linha)
+        estaticas = len(instrucoes) + (1 + len(trampolins) if usar_trampolins else 0)
+        return "\n".join(linhas) + "\n", estaticas, usar_trampolins
+
+
+def gerar_programa(semente: Optional[int] = None, **parametros) -> ProgramaGerado:
+    """Atalho: GeradorProgramas(semente, **parametros).gerar()."""
+    return GeradorProgramas(semente, **parametros).gerar()
@@ -54,6 +54,22 @@ INSTRUCOES = {
     "blt": "00011110"       # Branch if Less Than (Desvia se menor) (Opcode 30)
 }
 
+# Mapa reverso Opcode -> mnemônico (usado pelo desmontador).
+# Em caso de opcode repetido ("loadi" e "div"), prevalece a última entrada, que é a executada pelo processador.
+OPCODES = {int(bits, 2): mnemonico for mnemonico, bits in INSTRUCOES.items()}
+
+# ------------------------------
+# Formatos de Operandos (Categorias)
+# ------------------------------
+# Compartilhados entre o montador e o desmontador para manter os dois sentidos consistentes
+INSTR_TRES_REGS = ["add", "sub", "xor", "or", "and", "asl", "asr", "lsl", "lsr",
+                   "mul", "div", "mod"]
+INSTR_DOIS_REGS = ["passa", "neg", "inc", "dec", "not"]
+INSTR_CONSTANTE = ["lcl_msb", "lcl_lsb"]
+INSTR_MEMORIA = ["load", "store"]
+INSTR_SALTO_LONGO = ["jal", "j"]
+INSTR_DESVIO = ["beq", "bne", "bgt", "blt"]
+
 # ------------------------------
 # Funções Auxiliares
 # ------------------------------
@@ -114,8 +130,7 @@ def montar_instrucao(asm: str) -> str:
     const16 = end24 = 0
 
     # --- CATEGORIA 1: Instruções com 3 Registradores (Op Destino, Origem1, Origem2) ---
-    if mnemonic in ["add", "sub", "xor", "or", "and", "asl", "asr", "lsl", "lsr", 
-                    "mul", "div", "mod"]:
+    if mnemonic in INSTR_TRES_REGS:
         rc = _parse_operand(args[0]) # 1º argumento: Registrador Destino (RC)
         ra = _parse_operand(args[1]) # 2º argumento: Operando 1 (RA)
         rb = _parse_operand(args[2]) # 3º argumento: Operando 2 (RB)
@@ -126,22 +141,22 @@ def montar_instrucao(asm: str) -> str:
 
     # --- CATEGORIA 2: Instruções com 2 Registradores (Op Destino, Origem) ---
     # Inclui operações unárias e movimentação. NOT foi adicionado aqui corretamente.
-    elif mnemonic in ["passa", "neg", "inc", "dec", "not"]:
+    elif mnemonic in INSTR_DOIS_REGS:
         rc = _parse_operand(args[0]) # Destino (RC)
         ra = _parse_operand(args[1]) # Origem (RA)
 
     # --- CATEGORIA 3: Carregamento de Constantes (LCL) ---
-    elif mnemonic in ["lcl_msb", "lcl_lsb"]:
+    elif mnemonic in INSTR_CONSTANTE:
         rc = _parse_operand(args[0])      # Registrador alvo
         const16 = _parse_operand(args[1]) # Imediato de 16 bits
 
     # --- CATEGORIA 4: Acesso à Memória (Load/Store) ---
-    elif mnemonic in ["load", "store"]:
+    elif mnemonic in INSTR_MEMORIA:
         rc = _parse_operand(args[0]) # Registrador de Dados (RC)
         ra = _parse_operand(args[1]) # Registrador de Endereço (RA)
 
     # --- CATEGORIA 5: Jumps Incondicionais (Endereço longo) ---
-    elif mnemonic in ["jal", "j"]:
+    elif mnemonic in INSTR_SALTO_LONGO:
         end24 = _parse_operand(args[0]) # Endereço de 24 bits
 
     # --- CATEGORIA 6: Jump Register (Indireto) ---
@@ -150,7 +165,7 @@ def montar_instrucao(asm: str) -> str:
 
     # --- CATEGORIA 7: Branches Condicionais ---
     # Estrutura: Branch Op1, Op2, Endereço
-    elif mnemonic in ["beq", "bne", "bgt", "blt"]:
+    elif mnemonic in INSTR_DESVIO:
         ra = _parse_operand(args[0]) # Operando 1 para comparação
         rb = _parse_operand(args[1]) # Operando 2 para comparação
         rc = _parse_operand(args[2]) # Endereço de salto (armazenado no campo RC de 8 bits)
@@ -162,11 +177,11 @@ def montar_instrucao(asm: str) -> str:
     # --- MONTAGEM FINAL DA STRING BINÁRIA (32 bits) ---
     
     # Formato Tipo I (Imediato 16 bits): Opcode(8) + Const(16) + Reg(8)
-    if mnemonic in ["lcl_msb", "lcl_lsb"]:
+    if mnemonic in INSTR_CONSTANTE:
         return opcode + _to_bin(const16, 16) + _to_bin(rc, 8)
     
     # Formato Tipo J (Jump Longo): Opcode(8) + Endereço(24)
-    elif mnemonic in ["jal", "j"]:
+    elif mnemonic in INSTR_SALTO_LONGO:
         return opcode + _to_bin(end24, 24)
     
     # Formato Tipo R (Registradores): Opcode(8) + RA(8) + RB(8) + RC(8)
@@ -174,14 +189,49 @@ def montar_instrucao(asm: str) -> str:
     else:
         return opcode + _to_bin(ra, 8) + _to_bin(rb, 8) + _to_bin(rc, 8)
 
+def desmontar_instrucao(instrucao: int) -> str:
+    """
+    Operação inversa de montar_instrucao: converte uma palavra de 32 bits em texto Assembly.
+    Palavras com opcode desconhecido são exibidas como '.word 0x...'.
+    """
+    instrucao &= 0xFFFFFFFF
+    mnemonic = OPCODES.get((instrucao >> 24) & 0xFF)
+    if mnemonic is None:
+        return f".word 0x{instrucao:08X}"
+
+    # Extrai os campos com o mesmo layout usado pelo decodificador do processador
+    ra = (instrucao >> 16) & 0xFF
+    rb = (instrucao >> 8) & 0xFF
+    rc = instrucao & 0xFF
+    const16 = (instrucao >> 8) & 0xFFFF
+    end24 = instrucao & 0xFFFFFF
+
+    if mnemonic in INSTR_TRES_REGS:
+        return f"{mnemonic} r{rc}, r{ra}, r{rb}"
+    elif mnemonic == "zeros":
+        return f"zeros r{rc}"
+    elif mnemonic in INSTR_DOIS_REGS or mnemonic in INSTR_MEMORIA:
+        return f"{mnemonic} r{rc}, r{ra}"
+    elif mnemonic in INSTR_CONSTANTE:
+        return f"{mnemonic} r{rc}, {const16}"
+    elif mnemonic in INSTR_SALTO_LONGO:
+        return f"{mnemonic} {end24}"
+    elif mnemonic == "jr":
+        return f"jr r{rc}"
+    elif mnemonic in INSTR_DESVIO:
+        return f"{mnemonic} r{ra}, r{rb}, {rc}"
+    # Instruções sem operandos (halt)
+    return mnemonic
+
 # ------------------------------
 # Função Principal de Montagem (Assembly -> Binário)
 # ------------------------------
 
-def montar_arquivo_assembly(caminho_asm: str, caminho_bin_out: str) -> None:
+def montar_arquivo_assembly(caminho_asm: str, caminho_bin_out: str) -> bool:
     """
     Lê um arquivo .asm completo e gera o arquivo .bin correspondente.
     Suporta diretiva 'address X' para criar lacunas na memória.
+    Retorna False se a montagem falhou (o .bin pode ter ficado incompleto).
     """
     endereco = 0 # Contador de endereço de memória atual
     
@@ -225,7 +275,9 @@ def montar_arquivo_assembly(caminho_asm: str, caminho_bin_out: str) -> None:
                     endereco += 1
                     
         print(f"Arquivo {caminho_bin_out} gerado com sucesso!")
+        return True
         
     except Exception as e:
         # Captura e exibe erros de compilação (sintaxe inválida, arquivo não encontrado, etc)
-        print(f"Erro ao processar os arquivos: {e}")
\ No newline at end of file
+        print(f"Erro ao processar os arquivos: {e}")
+        return False
\ No newline at end of file
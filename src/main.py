@@ -1,20 +1,160 @@
 import sys
 import os
+import argparse
 from pathlib import Path
 
-# Adicionar src ao path
-sys.path.insert(0, str(Path(__file__).parent))
+# Adicionar src ao path (apenas se ainda não estiver, ex.: quando executado como script)
+SRC = str(Path(__file__).resolve().parent)
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
 
-from interpretador.interpretador import montar_arquivo_assembly
-from simulador.processador.processador_main import Processador
+# Os subsistemas (montador, processador, amostragem...) são importados dentro de cada comando:
+# assim um comando só paga a importação daquilo que realmente usa.
+
+PROGRAMA_PADRAO_ASM = os.path.join(SRC, "interpretador", "programa.asm")
+PROGRAMA_PADRAO_BIN = os.path.join(SRC, "interpretador", "programa.bin")
+
+# Nomes dos modelos de simulador/processador/prefetcher.py (repetidos aqui para o --help não importá-lo)
+PREFETCHERS = ("next-line", "stride", "stream")
+
+
+def _montar(caminho_asm: str, caminho_bin: str) -> None:
+    """Monta o .asm; se falhar, apaga o .bin incompleto (senão ele pareceria atualizado) e levanta ValueError."""
+    from interpretador.interpretador import montar_arquivo_assembly
+    if not montar_arquivo_assembly(caminho_asm, caminho_bin):
+        if os.path.exists(caminho_bin):
+            os.remove(caminho_bin)
+        raise ValueError(f"Falha ao montar {caminho_asm}")
+
+
+def _montar_se_necessario(caminho: str) -> str:
+    """Recebe um .asm ou .bin e devolve o .bin, montando apenas se o binário estiver desatualizado."""
+    if not caminho.endswith(".asm"):
+        return caminho
+    caminho_bin = caminho[:-4] + ".bin"
+    if os.path.exists(caminho_bin) and os.path.getmtime(caminho_bin) >= os.path.getmtime(caminho):
+        return caminho_bin
+    _montar(caminho, caminho_bin)
+    return caminho_bin
+
+
+# ------------------------------
+# Comandos
+# ------------------------------
+
+def comando_assemble(args):
+    saida = args.saida
+    if saida is None:
+        saida = (args.asm[:-4] if args.asm.endswith(".asm") else args.asm) + ".bin"
+    _montar(args.asm, saida)
+
+
+def comando_run(args):
+    from simulador.processador.processador_main import Processador
+    processador = Processador(_montar_se_necessario(args.programa), verbose=not args.silencioso,
+                              fusao=args.fusao, prefetch=args.prefetch)
+    amostragem = None
+    if args.amostragem:
+        from simulador.processador.amostragem import ConfigAmostragem
+        amostragem = ConfigAmostragem(periodo=args.periodo, janela=args.janela,
+                                      aquecimento=args.aquecimento)
+    if args.eventos:
+        from simulador.processador.eventos import Escalonador, Temporizador, PortaES, BASE_TEMPORIZADOR, BASE_PORTA
+        escalonador = Escalonador(processador)
+        escalonador.conectar(Temporizador(linha=0), BASE_TEMPORIZADOR)
+        escalonador.conectar(PortaES(linha=1), BASE_PORTA)
+    if args.breakpoint or args.watch:
+        from simulador.processador.depuracao import Depurador
+        depurador = Depurador(processador)
+        for pc in args.breakpoint:
+            depurador.adicionar_breakpoint(pc)
+        for endereco in args.watch:
+            depurador.adicionar_watchpoint(endereco, leitura=True, escrita=True)
+    processador.executar_programa(max_ciclos=args.max_ciclos, amostragem=amostragem)
+
+
+def comando_batch(args):
+    from simulador.processador.processador_main import Processador
+    for caminho in args.programas:
+        try:
+            processador = Processador(_montar_se_necessario(caminho), verbose=False, fusao=args.fusao,
+                                      prefetch=args.prefetch)
+            instrucoes = processador.executar_silencioso(args.max_ciclos)
+        except Exception as e:
+            print(f"✗ {caminho}: {e}")
+            continue
+        situacao = "HALT" if processador.parado else "limite de ciclos"
+        print(f"✓ {caminho}: {instrucoes} instruções ({situacao}) | "
+              f"{processador.cache_instrucoes.get_stats()} | {processador.cache_dados.get_stats()}")
+
+
+def comando_stats(args):
+    from interpretador.interpretador import OPCODES
+    from simulador.processador.processador_main import Processador
+    processador = Processador(_montar_se_necessario(args.programa), verbose=False, fusao=args.fusao,
+                              prefetch=args.prefetch)
+    contagem = {}
+    processador.executar_silencioso(args.max_ciclos, contagem)
+    total = sum(contagem.values())
+
+    print(f"=== Estatísticas: {args.programa} ===")
+    print(f"Instruções executadas: {total}{'' if processador.parado else ' (limite de ciclos atingido)'}")
+    print("\n--- Mix de Instruções ---")
+    for opcode, n in sorted(contagem.items(), key=lambda item: -item[1]):
+        print(f"{OPCODES.get(opcode, f'0x{opcode:02X}'):<8} {n:>10}  ({n / total:.1%})")
+    print("\n--- Caches ---")
+    print(processador.cache_instrucoes.get_stats())
+    print(processador.cache_dados.get_stats())
+    if processador.fusor is not None:
+        print(processador.fusor.get_stats())
+
+
+def comando_cfg(args):
+    from simulador.cfg import GrafoFluxoControle
+    caminho_bin = _montar_se_necessario(args.programa)
+    cfg = GrafoFluxoControle.de_arquivo_bin(caminho_bin)
+    texto = cfg.para_dot() if args.formato == "dot" else cfg.para_json()
+    if args.saida:
+        with open(args.saida, "w") as f:
+            f.write(texto + "\n")
+    else:
+        print(texto)
+
+
+def comando_prefetch(args):
+    from simulador.processador.prefetcher import comparar_prefetchers, formatar_comparacao
+    caminho_bin = _montar_se_necessario(args.programa)
+    try:
+        linhas = comparar_prefetchers(caminho_bin, tipos=args.tipos or None,
+                                      max_instrucoes=args.max_ciclos, latencia=args.latencia)
+    except Exception as e:
+        print(f"✗ Erro na execução: {e}")
+        return
+    print(formatar_comparacao(linhas))
+
+
+def comando_gerar(args):
+    from interpretador.gerador import gerar_programa
+    programa = gerar_programa(args.semente, tamanho_bloco=args.tamanho_bloco,
+                              profundidade_lacos=args.profundidade_lacos, footprint=args.footprint,
+                              profundidade_chamadas=args.profundidade_chamadas,
+                              alvo_instrucoes=args.alvo_instrucoes)
+    programa.salvar(args.saida)
+    print(f"✓ {args.saida}: semente {programa.semente}, {programa.instrucoes_estaticas} instruções estáticas, "
+          f"até {programa.instrucoes_dinamicas_max} dinâmicas")
+
+
+def executar_padrao():
+    """Fluxo original: monta interpretador/programa.asm e executa com logs ciclo a ciclo."""
+    from interpretador.interpretador import montar_arquivo_assembly
+    from simulador.processador.processador_main import Processador
 
-def main():
     # Caminhos
-    caminho_asm = "interpretador/programa.asm"
-    caminho_bin = "interpretador/programa.bin"
-    
+    caminho_asm = PROGRAMA_PADRAO_ASM
+    caminho_bin = PROGRAMA_PADRAO_BIN
+
     print("=== RISC Simulator ===\n")
-    
+
     # Step 1: Compilar Assembly
     print("1️⃣  Compilando Assembly...")
     try:
@@ -26,7 +166,7 @@ def main():
     except Exception as e:
         print(f"✗ Erro na compilação: {e}")
         return
-    
+
     # Step 2: Criar Processador e Carregar Programa
     print("2️⃣  Carregando programa no processador...")
     try:
@@ -35,10 +175,93 @@ def main():
     except Exception as e:
         print(f"✗ Erro ao carregar programa: {e}")
         return
-    
+
     # Step 3: Executar Programa
     print("3️⃣  Executando programa...\n")
     processador.executar_programa()
 
+
+def criar_parser():
+    parser = argparse.ArgumentParser(prog="main.py", description="Simulador UFLA-RISC (Grupo 2)")
+    sub = parser.add_subparsers(dest="comando")
+
+    p = sub.add_parser("assemble", help="Monta um arquivo .asm em .bin")
+    p.add_argument("asm")
+    p.add_argument("-o", "--saida", help="Arquivo .bin de saída (padrão: mesmo nome do .asm)")
+    p.set_defaults(func=comando_assemble)
+
+    def opcoes_execucao(p):
+        p.add_argument("--max-ciclos", type=int, default=1000)
+        p.add_argument("--fusao", action="store_true", help="Liga a fusão de pares de instruções")
+        p.add_argument("--prefetch", choices=PREFETCHERS, help="Prefetcher das caches L1")
+
+    p = sub.add_parser("run", help="Executa um programa (.asm é montado só se o .bin estiver desatualizado)")
+    p.add_argument("programa")
+    opcoes_execucao(p)
+    p.add_argument("-q", "--silencioso", action="store_true", help="Desliga os logs ciclo a ciclo")
+    p.add_argument("--amostragem", action="store_true", help="Simulação amostrada (CPI estimado)")
+    p.add_argument("--periodo", type=int, default=10000)
+    p.add_argument("--janela", type=int, default=1000)
+    p.add_argument("--aquecimento", type=int, default=500)
+    p.add_argument("--eventos", action="store_true",
+                   help="Escalonador de eventos com temporizador (0xFF10) e porta de E/S (0xFF20)")
+    p.add_argument("-b", "--breakpoint", type=int, action="append", default=[], metavar="PC",
+                   help="Para antes de executar a instrução em PC (pode repetir)")
+    p.add_argument("-w", "--watch", type=int, action="append", default=[], metavar="ENDERECO",
+                   help="Para após ler ou escrever a palavra ENDERECO (pode repetir)")
+    p.set_defaults(func=comando_run)
+
+    p = sub.add_parser("batch", help="Executa vários programas sem logs e resume cada um em uma linha")
+    p.add_argument("programas", nargs="+")
+    opcoes_execucao(p)
+    p.set_defaults(func=comando_batch)
+
+    p = sub.add_parser("stats", help="Mix dinâmico de instruções e estatísticas das caches")
+    p.add_argument("programa")
+    opcoes_execucao(p)
+    p.set_defaults(func=comando_stats)
+
+    p = sub.add_parser("cfg", help="Grafo de fluxo de controle, funções, laços e código inalcançável")
+    p.add_argument("programa")
+    p.add_argument("--formato", choices=("json", "dot"), default="json")
+    p.add_argument("-o", "--saida", help="Arquivo de saída (padrão: terminal)")
+    p.set_defaults(func=comando_cfg)
+
+    p = sub.add_parser("prefetch", help="Compara a taxa de miss das caches com cada prefetcher")
+    p.add_argument("programa")
+    p.add_argument("--max-ciclos", type=int, default=1000000)
+    p.add_argument("--latencia", type=int, default=4, help="Acessos à cache até um prefetch chegar")
+    p.add_argument("--tipos", nargs="+", choices=PREFETCHERS)
+    p.set_defaults(func=comando_prefetch)
+
+    p = sub.add_parser("gerar", help="Gera um programa aleatório válido (carga de trabalho ou fuzzing)")
+    p.add_argument("saida", help="Arquivo .asm de saída")
+    p.add_argument("--semente", type=int)
+    p.add_argument("--tamanho-bloco", type=int, default=12)
+    p.add_argument("--profundidade-lacos", type=int, default=2)
+    p.add_argument("--footprint", type=int, default=256)
+    p.add_argument("--profundidade-chamadas", type=int, default=2)
+    p.add_argument("--alvo-instrucoes", type=int, help="Instruções dinâmicas aproximadas (laço externo)")
+    p.set_defaults(func=comando_gerar)
+
+    return parser
+
+
+def main(argv=None):
+    parser = criar_parser()
+    args = parser.parse_args(argv)
+    if args.comando == "run" and args.amostragem and args.eventos:
+        parser.error("--amostragem não pode ser combinada com --eventos")
+    if args.comando == "run" and args.amostragem and (args.breakpoint or args.watch):
+        parser.error("--amostragem não pode ser combinada com -b/--breakpoint nem -w/--watch")
+    if args.comando is None:
+        executar_padrao()
+    else:
+        try:
+            args.func(args)
+        except ValueError as e:
+            # Erros de entrada (montagem, parâmetros de simulação): mensagem e código de saída 1
+            parser.exit(1, f"✗ {e}\n")
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
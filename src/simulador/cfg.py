@@ -0,0 +1,291 @@
+# src/simulador/cfg.py
+
+import json
+
+from interpretador.interpretador import desmontar_instrucao
+from simulador.processador.loader import ProgramLoader
+
+# ------------------------------
+# Grafo de Fluxo de Controle (CFG) e Análise Estática
+# ------------------------------
+# Constrói, a partir de uma imagem montada ({endereço: palavra}), os blocos básicos do
+# programa, o grafo de chamadas (JAL/JR), os laços naturais e o código inalcançável.
+#
+# Convenções do ISA usadas na análise:
+#   BEQ/BNE/BGT/BLT -> desvio condicional para o campo RC (8 bits) ou segue para PC+1
+#   J               -> salto incondicional para o endereço de 24 bits
+#   JAL             -> chamada: entra na função (endereço de 24 bits) e retorna em PC+1
+#   JR r31          -> retorno de função; JR com outro registrador é um salto indireto
+#   HALT            -> fim do programa
+
+JAL, JR, J = 18, 19, 22
+DESVIOS = {20, 21, 29, 30}      # BEQ, BNE, BGT, BLT
+HALT = 255
+REG_RETORNO = 31
+
+CONTROLE = DESVIOS | {JAL, JR, J, HALT}
+
+
+class BlocoBasico:
+    def __init__(self, inicio):
+        self.inicio = inicio
+        self.fim = inicio               # Endereço da última instrução (inclusive)
+        self.instrucoes = []            # Palavras de 32 bits, em ordem
+        self.sucessores = []            # Inícios dos blocos seguintes (dentro da função)
+        self.chamadas = []              # Entradas das funções chamadas via JAL
+        self.tipo_saida = "sequencial"  # sequencial, desvio, salto, chamada, retorno, indireto, halt, fim_da_imagem
+
+    def __len__(self):
+        return len(self.instrucoes)
+
+    def enderecos(self):
+        return range(self.inicio, self.fim + 1)
+
+
+class GrafoFluxoControle:
+    def __init__(self, imagem, entrada=0):
+        """
+        :param imagem: Dicionário {endereço: palavra de 32 bits} com o programa montado
+        :param entrada: Endereço da primeira instrução executada
+        """
+        self.imagem = dict(imagem)
+        self.entrada = entrada
+        self.blocos = {}        # início -> BlocoBasico (apenas código alcançável)
+        self.funcoes = {}       # entrada da função -> conjunto de inícios de blocos
+        self.grafo_chamadas = {}  # entrada da função -> conjunto de funções chamadas
+        self.lacos = []         # {'cabeca', 'funcao', 'blocos', 'enderecos'}
+        self.avisos = []        # Situações que a análise não conseguiu resolver estaticamente
+
+        self._construir_blocos()
+        self._construir_funcoes()
+        self._encontrar_lacos()
+
+        # Mapas de endereço -> bloco/função, para atribuição de tempo em profilers
+        self._bloco_de = {e: b.inicio for b in self.blocos.values() for e in b.enderecos()}
+        # Início do bloco -> funções e cabeças de laços (do mais externo para o mais interno) que o contêm
+        self._funcoes_do_bloco = {}
+        for funcao, blocos in sorted(self.funcoes.items()):
+            for inicio in blocos:
+                self._funcoes_do_bloco.setdefault(inicio, []).append(funcao)
+        self._lacos_do_bloco = {}
+        for laco in sorted(self.lacos, key=lambda l: -len(l['enderecos'])):
+            for inicio in laco['blocos']:
+                self._lacos_do_bloco.setdefault(inicio, []).append(laco['cabeca'])
+
+    @staticmethod
+    def de_arquivo_bin(caminho_bin: str):
+        """Monta o CFG a partir de um arquivo .bin gerado pelo montador."""
+        loader = ProgramLoader(caminho_bin)
+        imagem = {item['endereco']: int(item['instrucao'], 2) & 0xFFFFFFFF for item in loader.carregar()}
+        entrada = loader.endereco_inicio if loader.endereco_inicio is not None else 0
+        return GrafoFluxoControle(imagem, entrada)
+
+    # ------------------------------
+    # Decodificação dos Alvos
+    # ------------------------------
+    @staticmethod
+    def _alvos(endereco, palavra):
+        """Retorna (tipo de saída, sucessores intra-função, função chamada ou None)."""
+        opcode = (palavra >> 24) & 0xFF
+        if opcode in DESVIOS:
+            return "desvio", [palavra & 0xFF, endereco + 1], None
+        if opcode == J:
+            return "salto", [palavra & 0xFFFFFF], None
+        if opcode == JAL:
+            return "chamada", [endereco + 1], palavra & 0xFFFFFF
+        if opcode == JR:
+            return ("retorno" if palavra & 0xFF == REG_RETORNO else "indireto"), [], None
+        if opcode == HALT:
+            return "halt", [], None
+        return "sequencial", [endereco + 1], None
+
+    # ------------------------------
+    # Blocos Básicos
+    # ------------------------------
+    def _construir_blocos(self):
+        # Líderes: entrada, alvos de desvios/saltos/chamadas e instruções após um controle
+        lideres = {self.entrada}
+        for endereco, palavra in self.imagem.items():
+            if (palavra >> 24) & 0xFF in CONTROLE:
+                _, sucessores, chamada = self._alvos(endereco, palavra)
+                lideres.update(sucessores)
+                lideres.add(endereco + 1)
+                if chamada is not None:
+                    lideres.add(chamada)
+
+        # Percorre somente o que é alcançável a partir da entrada
+        pendentes = [self.entrada]
+        while pendentes:
+            inicio = pendentes.pop()
+            if inicio in self.blocos:
+                continue
+            if inicio not in self.imagem:
+                self.avisos.append(f"Salto para o endereço {inicio}, fora da imagem do programa")
+                continue
+
+            bloco = BlocoBasico(inicio)
+            endereco = inicio
+            while True:
+                palavra = self.imagem[endereco]
+                bloco.instrucoes.append(palavra)
+                bloco.fim = endereco
+                tipo, sucessores, chamada = self._alvos(endereco, palavra)
+                if tipo != "sequencial":
+                    break
+                if endereco + 1 not in self.imagem:
+                    tipo, sucessores = "fim_da_imagem", []
+                    self.avisos.append(f"A execução continua após o endereço {endereco}, fora da imagem do programa")
+                    break
+                if endereco + 1 in lideres:
+                    break
+                endereco += 1
+
+            bloco.tipo_saida = tipo
+            if tipo == "indireto":
+                self.avisos.append(f"JR com registrador diferente de r{REG_RETORNO} no endereço {endereco}")
+            bloco.sucessores = [s for s in dict.fromkeys(sucessores) if s in self.imagem]
+            for s in sucessores:
+                if s not in self.imagem and tipo != "chamada":
+                    self.avisos.append(f"Salto para o endereço {s}, fora da imagem do programa")
+            if chamada is not None:
+                bloco.chamadas.append(chamada)
+                pendentes.append(chamada)
+            self.blocos[inicio] = bloco
+            pendentes.extend(bloco.sucessores)
+
+    # ------------------------------
+    # Funções e Grafo de Chamadas
+    # ------------------------------
+    def _construir_funcoes(self):
+        entradas = [self.entrada] + sorted({c for b in self.blocos.values() for c in b.chamadas} - {self.entrada})
+        for funcao in entradas:
+            if funcao not in self.blocos:
+                continue
+            vistos = set()
+            pendentes = [funcao]
+            while pendentes:
+                inicio = pendentes.pop()
+                if inicio in vistos:
+                    continue
+                vistos.add(inicio)
+                pendentes.extend(self.blocos[inicio].sucessores)
+            self.funcoes[funcao] = vistos
+            self.grafo_chamadas[funcao] = {c for b in vistos for c in self.blocos[b].chamadas}
+
+    # ------------------------------
+    # Laços Naturais
+    # ------------------------------
+    def _dominadores(self, funcao, blocos):
+        """Algoritmo iterativo clássico: dom(n) = {n} ∪ ∩ dom(p), p predecessor de n."""
+        predecessores = {b: set() for b in blocos}
+        for b in blocos:
+            for s in self.blocos[b].sucessores:
+                if s in predecessores:
+                    predecessores[s].add(b)
+
+        dom = {b: set(blocos) for b in blocos}
+        dom[funcao] = {funcao}
+        mudou = True
+        while mudou:
+            mudou = False
+            for b in blocos:
+                if b == funcao:
+                    continue
+                preds = [dom[p] for p in predecessores[b]]
+                novo = {b} | (set.intersection(*preds) if preds else set())
+                if novo != dom[b]:
+                    dom[b] = novo
+                    mudou = True
+        return dom, predecessores
+
+    def _encontrar_lacos(self):
+        for funcao, blocos in self.funcoes.items():
+            dom, predecessores = self._dominadores(funcao, blocos)
+            cabecas = {}
+            for b in blocos:
+                for s in self.blocos[b].sucessores:
+                    if s in blocos and s in dom[b]:
+                        # Aresta de retorno b -> s: o laço natural são os blocos que chegam a b sem passar por s
+                        corpo = cabecas.setdefault(s, {s})
+                        pendentes = [b]
+                        while pendentes:
+                            n = pendentes.pop()
+                            if n not in corpo:
+                                corpo.add(n)
+                                pendentes.extend(predecessores[n])
+            for cabeca, corpo in sorted(cabecas.items()):
+                self.lacos.append({
+                    'cabeca': cabeca,
+                    'funcao': funcao,
+                    'blocos': sorted(corpo),
+                    'enderecos': sorted(e for b in corpo for e in self.blocos[b].enderecos()),
+                })
+
+    # ------------------------------
+    # Consultas
+    # ------------------------------
+    def enderecos_alcancaveis(self):
+        """Endereços de todas as instruções alcançáveis a partir da entrada."""
+        return sorted(self._bloco_de)
+
+    def inalcancaveis(self):
+        """Endereços da imagem que nenhum caminho a partir da entrada executa."""
+        return sorted(set(self.imagem) - set(self._bloco_de))
+
+    def bloco_de(self, endereco):
+        """Bloco básico que contém o endereço (ou None se inalcançável)."""
+        inicio = self._bloco_de.get(endereco)
+        return self.blocos[inicio] if inicio is not None else None
+
+    def funcoes_de(self, endereco):
+        """Entradas das funções cujo corpo contém o endereço (código compartilhado pode ter várias)."""
+        return list(self._funcoes_do_bloco.get(self._bloco_de.get(endereco), ()))
+
+    def lacos_de(self, endereco):
+        """Cabeças dos laços que contêm o endereço, do mais externo para o mais interno."""
+        return list(self._lacos_do_bloco.get(self._bloco_de.get(endereco), ()))
+
+    # ------------------------------
+    # Exportação
+    # ------------------------------
+    def para_dict(self):
+        return {
+            'entrada': self.entrada,
+            'blocos': [{
+                'inicio': b.inicio,
+                'fim': b.fim,
+                'saida': b.tipo_saida,
+                'sucessores': b.sucessores,
+                'chamadas': b.chamadas,
+                'instrucoes': [desmontar_instrucao(p) for p in b.instrucoes],
+            } for _, b in sorted(self.blocos.items())],
+            'funcoes': {str(f): sorted(blocos) for f, blocos in self.funcoes.items()},
+            'grafo_chamadas': {str(f): sorted(c) for f, c in self.grafo_chamadas.items()},
+            'lacos': [{k: l[k] for k in ('cabeca', 'funcao', 'blocos')} for l in self.lacos],
+            'inalcancaveis': self.inalcancaveis(),
+            'avisos': self.avisos,
+        }
+
+    def para_json(self, indent=2):
+        return json.dumps(self.para_dict(), indent=indent, ensure_ascii=False)
+
+    def para_dot(self):
+        """Exporta no formato Graphviz: um cluster por função; arestas de chamada tracejadas."""
+        linhas = ["digraph cfg {", '  node [shape=box, fontname="monospace"];']
+        for funcao, blocos in self.funcoes.items():
+            linhas.append(f'  subgraph cluster_{funcao} {{ label="função {funcao}";')
+            for inicio in sorted(blocos):
+                b = self.blocos[inicio]
+                texto = "\\l".join(f"{e}: {desmontar_instrucao(p)}" for e, p in zip(b.enderecos(), b.instrucoes))
+                linhas.append(f'    b{inicio} [label="{texto}\\l"];')
+            linhas.append("  }")
+        cabecas = {l['cabeca'] for l in self.lacos}
+        for inicio, b in sorted(self.blocos.items()):
+            if inicio in cabecas:
+                linhas.append(f"  b{inicio} [penwidth=2];")
+            for s in b.sucessores:
+                linhas.append(f"  b{inicio} -> b{s};")
+            for c in b.chamadas:
+                linhas.append(f"  b{inicio} -> b{c} [style=dashed];")
+        linhas.append("}")
+        return "\n".join(linhas)
@@ -0,0 +1,262 @@
+# src/simulador/cosimulacao.py
+
+import copy
+
+from interpretador.interpretador import desmontar_instrucao
+
+# ------------------------------
+# Co-simulação em Lockstep (Verificação Diferencial)
+# ------------------------------
+# Executa um motor de referência (o Processador interpretado) e um motor candidato
+# (qualquer caminho de execução mais rápido) lado a lado, comparando o estado arquitetural.
+#
+# Um "motor" é qualquer objeto com a mesma interface pública do Processador:
+#   executar_passo(), registradores.regs, pc.load(), flags, memoria.load() e parado.
+#
+# A memória comparada são as palavras sujas (Memoria.sujas) dos dois motores; para motores
+# sem esse rastreamento, usam-se os endereços dos STOREs observados.
+
+OPCODE_STORE = 17
+OPCODE_HALT = 255
+
+# Opcodes que encerram um bloco básico (JAL, JR, BEQ, BNE, J, BGT, BLT e HALT)
+OPCODES_FIM_DE_BLOCO = {18, 19, 20, 21, 22, 29, 30, OPCODE_HALT}
+
+# Modos de verificação:
+#   "instrucao" -> compara o estado completo a cada `intervalo` instruções
+#   "bloco"     -> compara o estado completo a cada `intervalo` blocos básicos
+#   "hash"      -> compara apenas hashes acumulados do estado a cada `intervalo` instruções
+MODOS = ("instrucao", "bloco", "hash")
+
+
+def capturar_estado(motor, enderecos=()):
+    """Tira uma fotografia do estado arquitetural do motor (memória apenas nos endereços pedidos)."""
+    flags = motor.flags
+    return {
+        'pc': motor.pc.load(),
+        'registradores': list(motor.registradores.regs),
+        'flags': (flags.neg, flags.zero, flags.carry, flags.overflow),
+        'parado': motor.parado,
+        'memoria': {e: motor.memoria.load(e) for e in sorted(enderecos)},
+    }
+
+
+def comparar_estados(estado_ref, estado_cand):
+    """Retorna a lista (vazia se iguais) com a descrição de cada diferença encontrada."""
+    diferencas = []
+    if estado_ref['pc'] != estado_cand['pc']:
+        diferencas.append(f"PC: ref={estado_ref['pc']} cand={estado_cand['pc']}")
+    for i, (a, b) in enumerate(zip(estado_ref['registradores'], estado_cand['registradores'])):
+        if a != b:
+            diferencas.append(f"R{i}: ref={a} (0x{a:X}) cand={b} (0x{b:X})")
+    if estado_ref['flags'] != estado_cand['flags']:
+        diferencas.append(f"Flags (neg, zero, carry, overflow): ref={estado_ref['flags']} cand={estado_cand['flags']}")
+    if estado_ref['parado'] != estado_cand['parado']:
+        diferencas.append(f"HALT: ref={estado_ref['parado']} cand={estado_cand['parado']}")
+    for endereco, a in estado_ref['memoria'].items():
+        b = estado_cand['memoria'].get(endereco)
+        if a != b:
+            diferencas.append(f"Mem[{endereco}]: ref={a} cand={b}")
+    return diferencas
+
+
+class Divergencia:
+    """Relatório da primeira instrução cuja execução deixou os motores em estados diferentes."""
+
+    def __init__(self, passo, pc, instrucao, estado_ref, estado_cand, diferencas):
+        self.passo = passo              # Número da instrução dinâmica (1 = primeira executada)
+        self.pc = pc                    # Endereço da instrução divergente
+        self.instrucao = instrucao      # Palavra de 32 bits lida da memória do motor de referência
+        self.desmontagem = desmontar_instrucao(instrucao)
+        self.estado_ref = estado_ref
+        self.estado_cand = estado_cand
+        self.diferencas = diferencas
+
+    def __str__(self):
+        linhas = [
+            f"✗ Divergência na instrução #{self.passo} (PC={self.pc}): "
+            f"{self.desmontagem}  [{self.instrucao:032b}]"
+        ]
+        linhas += [f"    - {d}" for d in self.diferencas]
+        return "\n".join(linhas)
+
+
+class CoSimulador:
+    def __init__(self, referencia, candidato, modo: str = "instrucao", intervalo: int = 1):
+        """
+        :param referencia: Motor considerado correto (normalmente um Processador)
+        :param candidato: Motor sob verificação
+        :param modo: "instrucao", "bloco" ou "hash" (ver MODOS)
+        :param intervalo: Quantidade de instruções (ou blocos) entre duas verificações
+        """
+        if modo not in MODOS:
+            raise ValueError(f"Modo de co-simulação desconhecido: {modo}")
+        if intervalo < 1:
+            raise ValueError("O intervalo de verificação deve ser >= 1")
+        self.referencia = referencia
+        self.candidato = candidato
+        self.modo = modo
+        self.intervalo = intervalo
+
+        self.passos = 0             # Instruções executadas em lockstep
+        self.verificacoes = 0       # Comparações de estado (ou de hash) realizadas
+        self.divergencia = None
+
+    # ------------------------------
+    # Passo em Lockstep
+    # ------------------------------
+    def _passo(self, motor, enderecos):
+        """
+        Executa um passo do motor, registrando escrita em memória e HALT.
+        Retorna (dec, instruções retiradas): motores com fusão podem retirar mais de uma por passo.
+        """
+        dec = motor.executar_passo()
+        if not isinstance(dec, dict):
+            return dec, 1
+        if dec.get('opcode') == OPCODE_STORE:
+            enderecos.add(motor.registradores.load(dec['rc_idx']))
+        elif dec.get('opcode') == OPCODE_HALT:
+            # Mesmo tratamento dado ao HALT em Processador.executar_programa
+            motor.parado = True
+        return dec, dec.get('instrucoes', 1)
+
+    def _sincronizar(self, par, alvo, enderecos):
+        """
+        Avança o motor que está atrás até que ambos tenham retirado o mesmo número (>= alvo)
+        de instruções, ou até que isso seja impossível (HALT). Retorna True se o motor de
+        referência terminou um bloco básico nesse trecho.
+        """
+        fim_de_bloco = False
+        while True:
+            if par.n_ref == par.n_cand and (par.n_ref >= alvo or (par.ref.parado and par.cand.parado)):
+                break
+            if par.n_ref <= par.n_cand:
+                if par.ref.parado:
+                    break
+                dec, retiradas = self._passo(par.ref, enderecos)
+                par.n_ref += retiradas
+                if isinstance(dec, dict) and dec.get('opcode') in OPCODES_FIM_DE_BLOCO:
+                    fim_de_bloco = True
+            else:
+                if par.cand.parado:
+                    break
+                par.n_cand += self._passo(par.cand, enderecos)[1]
+        return fim_de_bloco
+
+    @staticmethod
+    def _sujas(par, enderecos):
+        """Endereços a comparar: STOREs observados + palavras sujas das duas memórias."""
+        return (enderecos | getattr(par.ref.memoria, 'sujas', set())
+                | getattr(par.cand.memoria, 'sujas', set()))
+
+    @staticmethod
+    def _hash_estado(acumulado, motor, escritas):
+        """Mistura o estado visível no ponto de sincronismo no hash acumulado (rolling hash)."""
+        flags = motor.flags
+        memoria = tuple((e, motor.memoria.load(e)) for e in sorted(escritas))
+        return hash((acumulado, motor.pc.load(), tuple(motor.registradores.regs),
+                     flags.neg, flags.zero, flags.carry, flags.overflow, motor.parado, memoria))
+
+    # ------------------------------
+    # Execução Principal
+    # ------------------------------
+    def executar(self, max_passos: int = 100000):
+        """
+        Executa os dois motores até HALT (em ambos), divergência ou `max_passos`.
+        Retorna None se os motores concordaram do início ao fim, ou a Divergencia encontrada.
+        """
+        # Cópia do estado inicial: usada para reproduzir a execução durante a bissecção
+        self._inicial = copy.deepcopy(_ParDeMotores(self.referencia, self.candidato))
+
+        par = _ParDeMotores(self.referencia, self.candidato)
+        enderecos = set()       # Endereços escritos por qualquer um dos motores
+        hash_ref = hash_cand = 0
+        blocos = 0
+        ultimo_ok = 0           # Último ponto em que os estados comprovadamente coincidiam
+
+        while par.n_ref < max_passos and not (par.ref.parado and par.cand.parado):
+            anterior = par.n_ref
+            escritas = set()
+            fim_de_bloco = self._sincronizar(par, anterior + 1, escritas)
+            enderecos |= escritas
+            self.passos = par.n_ref
+
+            if self.modo == "hash":
+                hash_ref = self._hash_estado(hash_ref, par.ref, escritas)
+                hash_cand = self._hash_estado(hash_cand, par.cand, escritas)
+                verificar = par.n_ref // self.intervalo > anterior // self.intervalo
+            elif self.modo == "bloco":
+                blocos += fim_de_bloco
+                verificar = fim_de_bloco and blocos % self.intervalo == 0
+            else:
+                verificar = par.n_ref // self.intervalo > anterior // self.intervalo
+
+            # No fim da execução (HALT, limite ou dessincronia) sempre comparamos o estado completo
+            final = (par.ref.parado or par.cand.parado or par.n_ref >= max_passos
+                     or par.n_ref != par.n_cand)
+            if not (verificar or final):
+                continue
+
+            self.verificacoes += 1
+            if self.modo == "hash" and not final:
+                iguais = hash_ref == hash_cand
+            else:
+                sujas = self._sujas(par, enderecos)
+                iguais = (par.n_ref == par.n_cand and
+                          not comparar_estados(capturar_estado(par.ref, sujas),
+                                               capturar_estado(par.cand, sujas)))
+            if not iguais:
+                self.divergencia = self._bisseccionar(ultimo_ok, par.n_ref)
+                return self.divergencia
+            ultimo_ok = par.n_ref
+
+        return None
+
+    # ------------------------------
+    # Bissecção da Divergência
+    # ------------------------------
+    def _bisseccionar(self, inicio, fim):
+        """
+        Localiza a primeira instrução divergente entre os pontos `inicio` (estados iguais)
+        e `fim` (estados diferentes), reexecutando a partir da cópia inicial.
+        """
+        base = copy.deepcopy(self._inicial)
+        enderecos = set()
+        self._sincronizar(base, inicio, enderecos)
+
+        baixo, alto = base.n_ref, fim   # Invariante: iguais em `baixo`, diferentes em `alto`
+        while alto - baixo > 1:
+            meio = (baixo + alto) // 2
+            par = copy.deepcopy(base)
+            end_meio = set(enderecos)
+            self._sincronizar(par, meio, end_meio)
+            if par.n_ref >= alto:
+                break   # Não há ponto de sincronismo estritamente entre `baixo` e `alto`
+            sujas = self._sujas(par, end_meio)
+            if par.n_ref != par.n_cand or comparar_estados(capturar_estado(par.ref, sujas),
+                                                           capturar_estado(par.cand, sujas)):
+                alto = par.n_ref
+            else:
+                baixo, base, enderecos = par.n_ref, par, end_meio
+
+        # Executa o trecho divergente a partir do último estado conhecido como igual
+        pc = base.ref.pc.load()
+        instrucao = base.ref.memoria.load(pc)
+        self._sincronizar(base, baixo + 1, enderecos)
+        sujas = self._sujas(base, enderecos)
+        estado_ref = capturar_estado(base.ref, sujas)
+        estado_cand = capturar_estado(base.cand, sujas)
+        diferencas = comparar_estados(estado_ref, estado_cand)
+        if base.n_ref != base.n_cand:
+            diferencas.append(f"Instruções retiradas: ref={base.n_ref} cand={base.n_cand}")
+        return Divergencia(baixo + 1, pc, instrucao, estado_ref, estado_cand, diferencas)
+
+
+class _ParDeMotores:
+    """Os dois motores em lockstep e quantas instruções cada um já retirou."""
+
+    def __init__(self, referencia, candidato):
+        self.ref = referencia
+        self.cand = candidato
+        self.n_ref = 0
+        self.n_cand = 0
@@ -0,0 +1,160 @@
+# src/simulador/processador/amostragem.py
+
+import math
+import statistics
+
+from .cache import AcessoDireto
+
+# ------------------------------
+# Simulação Amostrada (Sampled Simulation)
+# ------------------------------
+# Alterna trechos de avanço rápido puramente funcional (sem caches e sem logs) com janelas
+# detalhadas periódicas. Cada período tem o formato:
+#
+#   |-- aquecimento --|-- janela medida --|------ avanço funcional ------|
+#
+# A parte detalhada vem primeiro para que até uma execução mais curta que um período produza
+# uma janela. O aquecimento executa com as caches ligadas, mas sem contar estatísticas, para reduzir o
+# viés de caches frias. As métricas das janelas medidas são extrapoladas para o programa todo
+# com intervalo de confiança (aproximação normal sobre as médias das janelas).
+#
+# Modelo de tempo: 1 ciclo por instrução + `penalidade_miss` ciclos por miss (instrução ou dado).
+
+
+class ConfigAmostragem:
+    def __init__(self, periodo: int = 10000, janela: int = 1000, aquecimento: int = 500,
+                 penalidade_miss: int = 10, confianca: float = 0.95):
+        """
+        :param periodo: Instruções por período de amostragem
+        :param janela: Instruções medidas em detalhe em cada período
+        :param aquecimento: Instruções detalhadas (não medidas) antes de cada janela
+        :param penalidade_miss: Ciclos extras por miss de cache no modelo de tempo
+        :param confianca: Nível de confiança dos intervalos (ex.: 0.95)
+        """
+        if janela < 1 or aquecimento < 0:
+            raise ValueError("Janela deve ser >= 1 e aquecimento >= 0")
+        if janela + aquecimento > periodo:
+            raise ValueError("Janela + aquecimento não podem exceder o período de amostragem")
+        if not 0 < confianca < 1:
+            raise ValueError("Confiança deve estar entre 0 e 1")
+        self.periodo = periodo
+        self.janela = janela
+        self.aquecimento = aquecimento
+        self.penalidade_miss = penalidade_miss
+        self.confianca = confianca
+
+
+class Estimativa:
+    """
+    Média das janelas com a margem do intervalo de confiança (None se houver < 2 amostras).
+    Sem nenhuma amostra, a média também é None: a métrica não foi medida.
+    """
+
+    def __init__(self, amostras, confianca):
+        self.n = len(amostras)
+        self.confianca = confianca
+        self.media = statistics.fmean(amostras) if amostras else None
+        self.margem = None
+        if self.n >= 2:
+            z = statistics.NormalDist().inv_cdf((1 + confianca) / 2)
+            self.margem = z * statistics.stdev(amostras) / math.sqrt(self.n)
+
+    def __str__(self):
+        if self.media is None:
+            return "indisponível (nenhuma janela medida)"
+        if self.margem is None:
+            return f"{self.media:.4f} (amostras insuficientes para o intervalo)"
+        return f"{self.media:.4f} ± {self.margem:.4f} ({self.confianca:.0%}, n={self.n})"
+
+
+class ResultadoAmostragem:
+    def __init__(self, config, instrucoes, janelas):
+        self.config = config
+        self.instrucoes = instrucoes        # Instruções executadas no programa todo
+        self.janelas = janelas              # Métricas de cada janela medida
+
+        def coletar(chave):
+            return [j[chave] for j in janelas if j[chave] is not None]
+
+        self.cpi = Estimativa(coletar('cpi'), config.confianca)
+        self.taxa_miss_instrucoes = Estimativa(coletar('taxa_miss_instrucoes'), config.confianca)
+        self.taxa_miss_dados = Estimativa(coletar('taxa_miss_dados'), config.confianca)
+
+    @property
+    def ciclos_estimados(self):
+        """Ciclos totais extrapolados a partir do CPI médio das janelas (None sem janelas)."""
+        if self.cpi.media is None:
+            return None
+        return self.cpi.media * self.instrucoes
+
+    def __str__(self):
+        medidas = sum(j['instrucoes'] for j in self.janelas)
+        ciclos = self.ciclos_estimados
+        return "\n".join([
+            "\n--- Simulação Amostrada ---",
+            f"Instruções executadas: {self.instrucoes} (detalhadas e medidas: {medidas}, "
+            f"janelas: {len(self.janelas)})",
+            f"CPI estimado: {self.cpi}",
+            f"Ciclos estimados: {'indisponível' if ciclos is None else f'{ciclos:.0f}'}",
+            f"Taxa de miss L1 Instruções: {self.taxa_miss_instrucoes}",
+            f"Taxa de miss L1 Dados: {self.taxa_miss_dados}",
+        ])
+
+
+def _taxa(hits, misses):
+    acessos = hits + misses
+    return misses / acessos if acessos else None
+
+
+def executar_amostrado(cpu, config: ConfigAmostragem, max_instrucoes: int):
+    """
+    Executa o programa carregado em `cpu` no modo amostrado e retorna o ResultadoAmostragem.
+    Não combina com um Escalonador (o avanço funcional ignoraria eventos e dispositivos) nem
+    com um Depurador (o avanço não para em breakpoints e troca a cache vigiada por AcessoDireto).
+    """
+    if cpu.escalonador is not None:
+        raise ValueError("Simulação amostrada não suporta o escalonador de eventos")
+    if cpu.depurador is not None:
+        raise ValueError("Simulação amostrada não suporta breakpoints nem watchpoints")
+    cache_i, cache_d = cpu.cache_instrucoes, cpu.cache_dados
+    direto_i, direto_d = AcessoDireto(cache_i), AcessoDireto(cache_d)
+    verbose = cpu.verbose
+    avanco = config.periodo - config.aquecimento - config.janela
+
+    instrucoes = 0
+    janelas = []
+    try:
+        while not cpu.parado and instrucoes < max_instrucoes:
+            # 1. Aquecimento: caches ligadas, estatísticas descartadas
+            cpu.cache_instrucoes, cpu.cache_dados = cache_i, cache_d
+            cpu.verbose = verbose
+            instrucoes += cpu.executar_silencioso(min(config.aquecimento, max_instrucoes - instrucoes))
+
+            # 2. Janela medida
+            antes = (cache_i.hits, cache_i.misses, cache_d.hits, cache_d.misses)
+            n = cpu.executar_silencioso(min(config.janela, max_instrucoes - instrucoes))
+            instrucoes += n
+            if n == 0:
+                break
+            hits_i, misses_i = cache_i.hits - antes[0], cache_i.misses - antes[1]
+            hits_d, misses_d = cache_d.hits - antes[2], cache_d.misses - antes[3]
+            janelas.append({
+                'inicio': instrucoes - n,
+                'instrucoes': n,
+                'cpi': (n + config.penalidade_miss * (misses_i + misses_d)) / n,
+                'taxa_miss_instrucoes': _taxa(hits_i, misses_i),
+                'taxa_miss_dados': _taxa(hits_d, misses_d),
+            })
+
+            # 3. Avanço funcional: sem caches e sem logs
+            cpu.cache_instrucoes, cpu.cache_dados = direto_i, direto_d
+            cpu.verbose = False
+            instrucoes += cpu.executar_silencioso(min(avanco, max_instrucoes - instrucoes))
+    finally:
+        cpu.cache_instrucoes, cpu.cache_dados = cache_i, cache_d
+        cpu.verbose = verbose
+
+    # Uma janela final incompleta só é aproveitada se for a única disponível
+    if len(janelas) > 1 and janelas[-1]['instrucoes'] < config.janela:
+        janelas.pop()
+    return ResultadoAmostragem(config, instrucoes, janelas)
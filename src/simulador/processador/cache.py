@@ -1,11 +1,13 @@
 # src/simulador/processador/cache.py
 
 class CacheL1:
-    def __init__(self, memoria_principal, nome="Cache L1"):
+    def __init__(self, memoria_principal, nome="Cache L1", prefetcher=None, latencia_prefetch=4):
         """
         Inicializa a Cache L1.
         :param memoria_principal: Referência para o objeto Memoria (RAM)
         :param nome: Identificador para logs (ex: "Cache Instruções")
+        :param prefetcher: Opcional, modelo de prefetch (ver prefetcher.py)
+        :param latencia_prefetch: Acessos a esta cache até um prefetch emitido chegar
         """
         self.memoria = memoria_principal
         self.nome = nome
@@ -16,28 +18,111 @@ class CacheL1:
         self.hits = 0
         self.misses = 0
 
-    def load(self, endereco):
-        """Lê um valor da cache. Se não existir (Miss), busca na RAM."""
+        # Prefetch: endereços emitidos e ainda não pedidos -> "instante" de chegada.
+        # O tempo da cache é o número de acessos de demanda (hits + misses); o valor é lido
+        # da RAM só quando a linha é pedida, então o prefetch nunca fica incoerente.
+        self.prefetcher = prefetcher
+        self.latencia_prefetch = latencia_prefetch
+        self.pendentes = {}
+        self.prefetch_emitidos = 0
+        self.prefetch_uteis = 0       # Pedidos depois da chegada: viraram hit
+        self.prefetch_atrasados = 0   # Pedidos antes da chegada: ainda contam como miss
+
+    @property
+    def prefetch_inuteis(self):
+        """Prefetches nunca pedidos (ou sobrescritos por um store antes do pedido)."""
+        return self.prefetch_emitidos - self.prefetch_uteis - self.prefetch_atrasados
+
+    @property
+    def taxa_miss(self):
+        acessos = self.hits + self.misses
+        return self.misses / acessos if acessos else 0.0
+
+    def load(self, endereco, pc=None):
+        """Lê um valor da cache. Se não existir (Miss), busca na RAM. `pc` treina prefetchers por instrução."""
         if endereco in self.linhas:
             # Cache Hit: Retorna o valor armazenado na cache
             # print(f"[{self.nome}] HIT no endereço {endereco}") # (Opcional: Log de Hit)
             self.hits += 1
+            if self.prefetcher is not None:
+                self._prefetch(endereco, pc, "hit")
             return self.linhas[endereco]
+        elif endereco in self.pendentes:
+            # Linha trazida por prefetch: hit se já chegou, miss (atrasado) se ainda está a caminho
+            chegada = self.pendentes.pop(endereco)
+            if chegada <= self.hits + self.misses + 1: # Índice deste acesso
+                self.hits += 1
+                self.prefetch_uteis += 1
+                evento = "util"
+            else:
+                self.misses += 1
+                self.prefetch_atrasados += 1
+                evento = "atrasado"
+            valor = self.linhas[endereco] = self.memoria.load(endereco)
+            if self.prefetcher is not None: # Pode ter sido desligado com prefetches pendentes
+                self._prefetch(endereco, pc, evento)
+            return valor
         else:
             # Cache Miss: Busca na Memória Principal
             # print(f"[{self.nome}] MISS no endereço {endereco}") # (Opcional: Log de Miss)
             self.misses += 1
             valor = self.memoria.load(endereco)
             self.linhas[endereco] = valor # Atualiza a cache
+            if self.prefetcher is not None:
+                self._prefetch(endereco, pc, "miss")
             return valor
 
+    def _prefetch(self, endereco, pc, evento):
+        """Informa o acesso ao prefetcher e emite os endereços que ele pedir (ignora os já presentes)."""
+        chegada = self.hits + self.misses + self.latencia_prefetch
+        limite = len(self.memoria.dados)
+        for alvo in self.prefetcher.observar(endereco, pc, evento):
+            if 0 <= alvo < limite and alvo not in self.linhas and alvo not in self.pendentes:
+                self.pendentes[alvo] = chegada
+                self.prefetch_emitidos += 1
+
     def store(self, endereco, valor):
         """Escreve um valor (Write-Through: Cache + RAM)."""
-        # Atualiza a cache
+        # Atualiza a cache (um prefetch pendente do endereço perde o sentido)
         self.linhas[endereco] = valor
+        self.pendentes.pop(endereco, None)
         # Atualiza a memória principal imediatamente (Write-Through)
         self.memoria.store(endereco, valor)
         # print(f"[{self.nome}] WRITE no endereço {endereco} -> {valor}")
 
+    def pre_carregar(self, enderecos):
+        """Aquece a cache com os endereços dados (ex.: código alcançável do CFG), sem contar misses."""
+        for endereco in enderecos:
+            self.linhas[endereco] = self.memoria.load(endereco)
+            self.pendentes.pop(endereco, None)
+
+    def get_stats(self):
+        stats = f"{self.nome} - Hits: {self.hits}, Misses: {self.misses}"
+        if self.prefetcher is not None:
+            stats += (f", Prefetch {self.prefetcher.nome} - Úteis: {self.prefetch_uteis}, "
+                      f"Atrasados: {self.prefetch_atrasados}, Inúteis: {self.prefetch_inuteis}")
+        return stats
+
+class AcessoDireto:
+    def __init__(self, cache):
+        """
+        Caminho funcional (sem modelagem de cache): lê e escreve direto na RAM da cache envolvida.
+        Usado nos trechos de avanço rápido da simulação amostrada.
+        :param cache: CacheL1 que está sendo contornada
+        """
+        self.cache = cache
+        self.memoria = cache.memoria
+        self.nome = cache.nome
+
+    def load(self, endereco, pc=None):
+        """Lê direto da RAM, sem contar hit/miss, preencher a cache nem treinar o prefetcher."""
+        return self.memoria.load(endereco)
+
+    def store(self, endereco, valor):
+        """Escreve na RAM e mantém coerente a linha da cache, se ela já estiver presente."""
+        self.memoria.store(endereco, valor)
+        if endereco in self.cache.linhas:
+            self.cache.linhas[endereco] = self.memoria.load(endereco)
+
     def get_stats(self):
-        return f"{self.nome} - Hits: {self.hits}, Misses: {self.misses}"
\ No newline at end of file
+        return self.cache.get_stats()
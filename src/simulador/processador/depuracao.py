@@ -0,0 +1,216 @@
+# src/simulador/processador/depuracao.py
+
+# ------------------------------
+# Depuração: Breakpoints e Watchpoints
+# ------------------------------
+# Tudo é pré-computado para que cada verificação seja uma única consulta:
+#   breakpoints -> set de PCs; as condições sobre registradores só são avaliadas quando o PC está no set
+#   watchpoints -> bytearray com uma posição por palavra da memória, com os bits LEITURA/ESCRITA
+#
+# Sem depurador anexado, o laço de execução paga apenas um teste `is None` por passo. A cache de
+# dados só é envolvida pelo vigia (CacheVigiada) enquanto existir algum watchpoint; sem nenhum,
+# loads e stores seguem direto para a CacheL1.
+#
+# Um breakpoint para ANTES de executar a instrução do seu PC. Um watchpoint para DEPOIS da
+# instrução que fez o acesso (o valor já foi lido/escrito), como nos watchpoints de hardware.
+
+import operator
+
+LEITURA, ESCRITA = 1, 2
+TAMANHO_MEMORIA = 65536
+
+COMPARADORES = {
+    '==': operator.eq, '!=': operator.ne,
+    '<': operator.lt, '<=': operator.le,
+    '>': operator.gt, '>=': operator.ge,
+}
+
+
+class Parada:
+    def __init__(self, motivo, pc, endereco=None, valor=None, anterior=None):
+        self.motivo = motivo        # "breakpoint", "leitura" ou "escrita"
+        self.pc = pc                # Breakpoint: próxima instrução (não executada); watchpoint: a que acessou
+        self.endereco = endereco    # Watchpoints: palavra acessada
+        self.valor = valor          # Watchpoints: valor lido ou escrito
+        self.anterior = anterior    # Watchpoint de escrita: valor antes do store
+        self.instrucoes = 0         # Instruções executadas na chamada de executar_programa até a parada
+        self.registradores = []     # Cópia dos registradores no momento da parada
+
+    def concluir(self, cpu, instrucoes):
+        """Completa a parada com o estado do processador quando o laço de execução realmente para."""
+        self.instrucoes = instrucoes
+        self.registradores = list(cpu.registradores.regs)
+        return self
+
+    def __str__(self):
+        if self.motivo == "breakpoint":
+            return f"Breakpoint em PC={self.pc} (após {self.instrucoes} instruções)"
+        detalhe = f"Mem[{self.endereco}] = {self.valor}"
+        if self.motivo == "escrita":
+            detalhe += f" (antes: {self.anterior})"
+        return f"Watchpoint de {self.motivo} em PC={self.pc}: {detalhe} (após {self.instrucoes} instruções)"
+
+
+class CacheVigiada:
+    def __init__(self, cache, depurador):
+        """
+        Envolve a cache de dados e consulta o mapa de watchpoints a cada load/store.
+        :param cache: Cache envolvida (normalmente a CacheL1 de dados)
+        :param depurador: Depurador que recebe os acessos vigiados
+        """
+        self.cache = cache
+        self.memoria = cache.memoria
+        self.nome = cache.nome
+        self.mapa = depurador.mapa
+        self.depurador = depurador
+
+    def load(self, endereco, pc=None):
+        valor = self.cache.load(endereco, pc)
+        if self.mapa[endereco] & LEITURA:
+            self.depurador._acesso("leitura", endereco, valor)
+        return valor
+
+    def store(self, endereco, valor):
+        if self.mapa[endereco] & ESCRITA:
+            anterior = self.memoria.load(endereco)
+            self.cache.store(endereco, valor)
+            self.depurador._acesso("escrita", endereco, self.memoria.load(endereco), anterior)
+        else:
+            self.cache.store(endereco, valor)
+
+    def get_stats(self):
+        return self.cache.get_stats()
+
+    def __getattr__(self, nome):
+        # Demais atributos (linhas, hits, misses, pre_carregar...) vêm da cache envolvida
+        if nome == "cache":
+            raise AttributeError(nome)
+        return getattr(self.cache, nome)
+
+
+class Depurador:
+    def __init__(self, cpu):
+        """
+        Anexa um depurador ao processador (cpu.depurador). O laço de executar_programa passa a
+        parar nos breakpoints/watchpoints e retorna a Parada correspondente.
+        """
+        self.cpu = cpu
+        self.breakpoints = set()
+        self.condicoes = {}             # PC -> None (incondicional) ou [(registrador, comparador, valor)]
+        self.mapa = bytearray(TAMANHO_MEMORIA)
+        self.watchpoints = []           # (início, fim, modos) na ordem em que foram adicionados
+        self.pendente = None            # Parada de watchpoint detectada durante o passo atual
+        self.ignorar_pc = None          # Breakpoint em que a execução parou: pulado uma vez ao retomar
+        cpu.depurador = self
+
+    def desanexar(self):
+        """Remove o depurador do processador, devolvendo a cache de dados original."""
+        self.watchpoints.clear()
+        self._atualizar_vigia()
+        if self.cpu.depurador is self:
+            self.cpu.depurador = None
+
+    # ------------------------------
+    # Breakpoints
+    # ------------------------------
+    def adicionar_breakpoint(self, pc, condicao=None):
+        """
+        Para antes de executar a instrução em `pc`.
+        :param condicao: Opcional (registrador, comparador, valor), ex.: (5, '==', 3). Vários
+                         breakpoints condicionais no mesmo PC disparam se qualquer um for verdadeiro.
+        """
+        if condicao is None:
+            self.condicoes[pc] = None
+        else:
+            registrador, comparador, valor = condicao
+            if not 0 <= registrador < 32:
+                raise ValueError(f"Registrador inválido na condição: {registrador}")
+            if comparador not in COMPARADORES:
+                raise ValueError(f"Comparador inválido: {comparador!r} (use {', '.join(COMPARADORES)})")
+            if pc not in self.breakpoints or self.condicoes[pc] is not None:
+                self.condicoes.setdefault(pc, []).append((registrador, COMPARADORES[comparador], valor))
+        self.breakpoints.add(pc)
+
+    def remover_breakpoint(self, pc):
+        """Remove todos os breakpoints (condicionais ou não) de `pc`."""
+        self.breakpoints.discard(pc)
+        self.condicoes.pop(pc, None)
+
+    def antes_do_passo(self):
+        """Retorna a Parada se a próxima instrução tem um breakpoint ativo; senão None."""
+        pc = self.cpu._pc_get()
+        if pc not in self.breakpoints:
+            self.ignorar_pc = None
+            return None
+        if pc == self.ignorar_pc:
+            self.ignorar_pc = None
+            return None
+        condicoes = self.condicoes[pc]
+        if condicoes is not None:
+            regs = self.cpu.registradores
+            if not any(comparar(regs.load(r), valor) for r, comparar, valor in condicoes):
+                return None
+        self.ignorar_pc = pc
+        return Parada("breakpoint", pc)
+
+    # ------------------------------
+    # Watchpoints
+    # ------------------------------
+    def adicionar_watchpoint(self, inicio, fim=None, leitura=False, escrita=True):
+        """Vigia as palavras de `inicio` a `fim` (inclusive; padrão: só `inicio`)."""
+        fim = inicio if fim is None else fim
+        if not 0 <= inicio <= fim < TAMANHO_MEMORIA:
+            raise ValueError(f"Faixa de endereços inválida: {inicio}..{fim}")
+        modos = (LEITURA if leitura else 0) | (ESCRITA if escrita else 0)
+        if not modos:
+            raise ValueError("O watchpoint precisa vigiar leitura, escrita ou ambas")
+        self.watchpoints.append((inicio, fim, modos))
+        for endereco in range(inicio, fim + 1):
+            self.mapa[endereco] |= modos
+        self._atualizar_vigia()
+
+    def remover_watchpoint(self, inicio, fim=None):
+        """Remove os watchpoints com exatamente essa faixa; o mapa é refeito com os que sobraram."""
+        fim = inicio if fim is None else fim
+        self.watchpoints = [w for w in self.watchpoints if (w[0], w[1]) != (inicio, fim)]
+        self.mapa[:] = bytes(TAMANHO_MEMORIA)
+        for ini, f, modos in self.watchpoints:
+            for endereco in range(ini, f + 1):
+                self.mapa[endereco] |= modos
+        self._atualizar_vigia()
+
+    def _atualizar_vigia(self):
+        """Instala o vigia na cache de dados só enquanto houver watchpoints."""
+        acima, vigia = self._encontrar_vigia()
+        if self.watchpoints and vigia is None:
+            self.cpu.cache_dados = CacheVigiada(self.cpu.cache_dados, self)
+        elif not self.watchpoints and vigia is not None:
+            # O vigia pode ter sido envolvido depois (ex.: pelo Barramento de um Escalonador)
+            if acima is None:
+                self.cpu.cache_dados = vigia.cache
+            else:
+                acima.cache = vigia.cache
+
+    def _encontrar_vigia(self):
+        """Procura o vigia na cadeia de envoltórios da cache de dados: (envoltório acima, vigia)."""
+        acima, cache = None, self.cpu.cache_dados
+        while cache is not None and not isinstance(cache, CacheVigiada):
+            acima, cache = cache, getattr(cache, "cache", None)
+        return (acima, cache) if cache is not None else (None, None)
+
+    def _acesso(self, motivo, endereco, valor, anterior=None):
+        # O PC já aponta para a instrução seguinte quando a memória é acessada
+        if self.pendente is None:
+            self.pendente = Parada(motivo, self.cpu._pc_get() - 1, endereco, valor, anterior)
+
+    def depois_do_passo(self):
+        """Retorna (e consome) a Parada de watchpoint do passo que acabou de executar."""
+        parada, self.pendente = self.pendente, None
+        return parada
+
+    # ------------------------------
+    # Integração com a fusão de instruções
+    # ------------------------------
+    def permite_fusao(self, pc, tipo):
+        """Um par não pode esconder um breakpoint na 2ª instrução nem adiar a parada de um load vigiado."""
+        return pc + 1 not in self.breakpoints and not (tipo == "load_alu" and self.watchpoints)
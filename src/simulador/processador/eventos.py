@@ -0,0 +1,367 @@
+# src/simulador/processador/eventos.py
+
+# ------------------------------
+# Escalonador de Eventos, Dispositivos e Interrupções
+# ------------------------------
+# O tempo simulado é contado em instruções retiradas (a mesma unidade do contador de ciclos de
+# executar_programa). Dispositivos agendam eventos (tempo, ação) num heap; o laço do escalonador
+# executa instruções até o próximo evento, dispara os eventos vencidos e entrega interrupções.
+#
+# E/S mapeada em memória: o Barramento envolve a cache de dados e desvia para o dispositivo os
+# loads/stores dos endereços conectados (por padrão no topo da memória, a partir de 0xFF00).
+# Leituras de dispositivos não podem ter efeito colateral: o estado de um dispositivo só muda
+# por escrita do programa ou por evento. Registradores cujo valor muda sozinho com o tempo (ex.:
+# CONTAGEM do temporizador) são declarados em `volateis` e suas leituras são contadas.
+#
+# Interrupções (o UFLA-RISC não tem instrução de retorno de interrupção):
+#   - na entrega, R30 <- PC e PC <- VETOR do controlador; as interrupções ficam desabilitadas
+#   - o tratador retorna com `jr r30`; reabilitar (escrever 1 em HABILITA) só vale depois da
+#     instrução seguinte, então `store` (habilita) + `jr r30` não é interrompido no meio
+#   - R29 e R30 ficam reservados para o tratador nos programas que usam interrupções
+#
+# Laços ociosos: quando um desvio para trás chega ao mesmo PC com registradores e flags idênticos
+# à volta anterior, sem nenhum store, evento, interrupção ou leitura de registrador volátil no
+# meio, a máquina está num ciclo
+# determinístico que só um evento pode quebrar. O escalonador então avança o tempo em voltas
+# inteiras até o próximo evento (as voltas puladas não passam pelas caches).
+
+import functools
+import heapq
+
+BASE_CONTROLADOR = 0xFF00
+BASE_TEMPORIZADOR = 0xFF10
+BASE_PORTA = 0xFF20
+
+
+class Barramento:
+    def __init__(self, cache):
+        """
+        Envolve a cache de dados: endereços conectados vão para o dispositivo, o resto para a cache.
+        :param cache: Cache envolvida (normalmente a CacheL1 de dados)
+        """
+        self.cache = cache
+        self.memoria = cache.memoria
+        self.nome = cache.nome
+        self.mapa = {}          # endereço -> (dispositivo, deslocamento, volátil)
+        self.escritas = 0       # Stores (RAM ou dispositivo): usado na detecção de laços ociosos
+        self.leituras_volateis = 0  # Loads de registradores que mudam com o tempo: idem
+
+    def load(self, endereco, pc=None):
+        destino = self.mapa.get(endereco)
+        if destino is None:
+            return self.cache.load(endereco, pc)
+        if destino[2]:
+            self.leituras_volateis += 1
+        return destino[0].ler(destino[1]) & 0xFFFFFFFF
+
+    def store(self, endereco, valor):
+        self.escritas += 1
+        destino = self.mapa.get(endereco)
+        if destino is None:
+            self.cache.store(endereco, valor)
+        else:
+            destino[0].escrever(destino[1], valor & 0xFFFFFFFF)
+
+    def get_stats(self):
+        return self.cache.get_stats()
+
+    def __getattr__(self, nome):
+        # Demais atributos (linhas, hits, misses, prefetch...) vêm da cache envolvida
+        if nome == "cache":
+            raise AttributeError(nome)
+        return getattr(self.cache, nome)
+
+
+# ------------------------------
+# Dispositivos
+# ------------------------------
+# Interface: `quantidade` de registradores, conectar(escalonador), ler(deslocamento) e
+# escrever(deslocamento, valor); opcionalmente `volateis`, os deslocamentos cujo valor lido muda
+# sem escrita nem evento.
+
+class ControladorInterrupcoes:
+    HABILITA, PENDENTES, VETOR = 0, 1, 2
+    quantidade = 3
+
+    def __init__(self):
+        self.habilitado = False
+        self.ativacao = 0       # Passos até a habilitação valer (atraso de uma instrução)
+        self.pendentes = 0      # Máscara de linhas solicitadas
+        self.vetor = 0          # Endereço do tratador
+        self.escalonador = None
+
+    def conectar(self, escalonador):
+        self.escalonador = escalonador
+
+    def solicitar(self, linha):
+        """Chamado pelos dispositivos: marca a linha como pendente."""
+        self.pendentes |= 1 << linha
+
+    def ler(self, deslocamento):
+        if deslocamento == self.HABILITA:
+            return int(self.habilitado or self.ativacao > 0)
+        if deslocamento == self.PENDENTES:
+            return self.pendentes
+        return self.vetor
+
+    def escrever(self, deslocamento, valor):
+        if deslocamento == self.HABILITA:
+            if valor & 1:
+                self.ativacao = 2   # Passo atual (o store) + a próxima instrução
+            else:
+                self.habilitado = False
+                self.ativacao = 0
+        elif deslocamento == self.PENDENTES:
+            self.pendentes &= ~valor    # Escrever 1 limpa a linha (reconhecimento)
+        else:
+            self.vetor = valor
+
+    def passo_concluido(self):
+        self.ativacao -= 1
+        if self.ativacao == 0:
+            self.habilitado = True
+
+
+class Temporizador:
+    CONTROLE, PERIODO, STATUS, CONTAGEM = 0, 1, 2, 3
+    LIGADO, PERIODICO, INTERRUPCAO = 1, 2, 4
+    quantidade = 4
+    volateis = {CONTAGEM}
+
+    def __init__(self, linha=0):
+        """
+        Temporizador programável. CONTROLE: bit 0 liga, bit 1 periódico, bit 2 gera interrupção.
+        STATUS vira 1 a cada expiração (qualquer escrita zera); CONTAGEM lê o tempo atual.
+        :param linha: Linha de interrupção no controlador
+        """
+        self.linha = linha
+        self.controle = 0
+        self.periodo = 0
+        self.status = 0
+        self.expiracoes = 0
+        self.geracao = 0        # Reprogramar invalida os eventos já agendados
+        self.escalonador = None
+
+    def conectar(self, escalonador):
+        self.escalonador = escalonador
+
+    def ler(self, deslocamento):
+        if deslocamento == self.CONTROLE:
+            return self.controle
+        if deslocamento == self.PERIODO:
+            return self.periodo
+        if deslocamento == self.STATUS:
+            return self.status
+        return self.escalonador.tempo
+
+    def escrever(self, deslocamento, valor):
+        if deslocamento == self.CONTROLE:
+            self.controle = valor
+            self._programar()
+        elif deslocamento == self.PERIODO:
+            self.periodo = valor
+            self._programar()
+        elif deslocamento == self.STATUS:
+            self.status = 0
+        # CONTAGEM é somente leitura
+
+    def _programar(self):
+        self.geracao += 1
+        if self.controle & self.LIGADO and self.periodo > 0:
+            geracao = self.geracao
+            self.escalonador.agendar(self.periodo, functools.partial(self._expirar, geracao))
+
+    def _expirar(self, geracao):
+        if geracao != self.geracao:
+            return      # Evento de uma programação anterior
+        self.status = 1
+        self.expiracoes += 1
+        if self.controle & self.INTERRUPCAO:
+            self.escalonador.controlador.solicitar(self.linha)
+        if self.controle & self.PERIODICO:
+            # partial (e não lambda): a fila continua apontando para a cópia em um deepcopy
+            self.escalonador.agendar(self.periodo, functools.partial(self._expirar, geracao))
+
+
+class PortaES:
+    def __init__(self, quantidade=4, linha=None):
+        """
+        Registradores de E/S genéricos: o programa lê o que o "mundo externo" definiu e escreve saídas.
+        :param linha: Se definida, `definir` também solicita essa interrupção
+        """
+        self.quantidade = quantidade
+        self.linha = linha
+        self.valores = [0] * quantidade
+        self.saidas = []        # (tempo, registrador, valor) de cada escrita do programa
+        self.escalonador = None
+
+    def conectar(self, escalonador):
+        self.escalonador = escalonador
+
+    def definir(self, indice, valor):
+        """Lado externo: muda um registrador (normalmente dentro de um evento agendado)."""
+        self.valores[indice] = valor & 0xFFFFFFFF
+        if self.linha is not None:
+            self.escalonador.controlador.solicitar(self.linha)
+
+    def ler(self, deslocamento):
+        return self.valores[deslocamento]
+
+    def escrever(self, deslocamento, valor):
+        self.valores[deslocamento] = valor
+        self.saidas.append((self.escalonador.tempo, deslocamento, valor))
+
+
+# ------------------------------
+# Escalonador
+# ------------------------------
+
+class Escalonador:
+    def __init__(self, cpu, detectar_ociosidade=True):
+        """
+        Anexa o escalonador ao processador (cpu.escalonador): executar_programa passa a rodar por
+        ele. Já conecta um ControladorInterrupcoes em BASE_CONTROLADOR.
+        """
+        self.cpu = cpu
+        self.detectar_ociosidade = detectar_ociosidade
+        self.fila = []              # heap de (tempo, sequência, ação)
+        self._sequencia = 0         # Desempate: eventos no mesmo tempo disparam na ordem de agendamento
+        self.tempo = 0
+        self.instrucoes = 0         # Instruções realmente interpretadas
+        self.instrucoes_puladas = 0 # Instruções de laços ociosos avançadas sem interpretar
+        self.lacos_ociosos = 0
+        self.eventos_disparados = 0
+        self.interrupcoes = 0
+        self._volta = None          # Última passagem por um destino de desvio para trás
+
+        self.barramento = Barramento(cpu.cache_dados)
+        cpu.cache_dados = self.barramento
+        self.dispositivos = []
+        self.controlador = ControladorInterrupcoes()
+        self.conectar(self.controlador, BASE_CONTROLADOR)
+        cpu.escalonador = self
+
+    def conectar(self, dispositivo, base):
+        """Mapeia os registradores do dispositivo em base .. base + quantidade - 1."""
+        enderecos = range(base, base + dispositivo.quantidade)
+        if base < 0 or enderecos.stop > len(self.cpu.memoria.dados):
+            raise ValueError(f"Dispositivo fora da memória: {base}..{enderecos.stop - 1}")
+        if any(e in self.barramento.mapa for e in enderecos):
+            raise ValueError(f"Endereços {base}..{enderecos.stop - 1} já estão em uso por outro dispositivo")
+        volateis = getattr(dispositivo, "volateis", ())
+        for deslocamento, endereco in enumerate(enderecos):
+            self.barramento.mapa[endereco] = (dispositivo, deslocamento, deslocamento in volateis)
+        dispositivo.conectar(self)
+        self.dispositivos.append(dispositivo)
+        return dispositivo
+
+    def agendar(self, atraso, acao):
+        """Agenda `acao()` para daqui a `atraso` unidades de tempo."""
+        if atraso < 0:
+            raise ValueError("Não é possível agendar eventos no passado")
+        heapq.heappush(self.fila, (self.tempo + atraso, self._sequencia, acao))
+        self._sequencia += 1
+
+    def proximo_evento(self):
+        return self.fila[0][0] if self.fila else None
+
+    # ------------------------------
+    # Execução
+    # ------------------------------
+    def executar(self, max_tempo=1000):
+        """
+        Executa até HALT ou até o tempo simulado chegar a `max_tempo`. Com um Depurador anexado,
+        para no primeiro breakpoint/watchpoint e retorna a Parada (senão None).
+        """
+        cpu = self.cpu
+        depurador = cpu.depurador
+        while not cpu.parado and self.tempo < max_tempo:
+            if depurador is not None:
+                parada = depurador.antes_do_passo()
+                if parada is not None:
+                    return parada
+            self.executar_passo(max_tempo)
+            if depurador is not None:
+                parada = depurador.depois_do_passo()
+                if parada is not None:
+                    return parada
+        return None
+
+    def executar_passo(self, max_tempo=None):
+        """
+        Um passo do processador seguido do avanço do tempo: dispara os eventos vencidos e entrega
+        a interrupção pendente (o tratador começa no próximo passo). Retorna o resultado do passo,
+        como Processador.executar_passo (serve de motor para a co-simulação). Laços ociosos só
+        são pulados com `max_tempo`, que limita o salto quando não há eventos na fila.
+        """
+        cpu = self.cpu
+        controlador = self.controlador
+        pc = cpu._pc_get()
+        res = cpu.executar_passo()
+        n = res.get('instrucoes', 1)
+        self.tempo += n
+        self.instrucoes += n
+        if res['opcode'] == 255:
+            cpu.parado = True
+            return res
+        if controlador.ativacao:
+            controlador.passo_concluido()
+        if self.detectar_ociosidade and max_tempo is not None and cpu._pc_get() <= pc:
+            # Antes dos eventos: se o salto parar exatamente no tempo de um evento, ele dispara já
+            self._verificar_laco_ocioso(max_tempo)
+        while self.fila and self.fila[0][0] <= self.tempo:
+            _, _, acao = heapq.heappop(self.fila)
+            self.eventos_disparados += 1
+            acao()
+        if controlador.habilitado and controlador.pendentes:
+            self._entregar_interrupcao()
+        return res
+
+    def permite_fusao(self):
+        """
+        Um par fundido retira duas instruções de uma vez: não pode atravessar um evento que vence
+        depois da primeira, nem uma interrupção que seria entregue entre as duas.
+        """
+        controlador = self.controlador
+        return not (controlador.ativacao or controlador.pendentes
+                    or (self.fila and self.fila[0][0] <= self.tempo + 1))
+
+    def _entregar_interrupcao(self):
+        cpu = self.cpu
+        controlador = self.controlador
+        pc = cpu._pc_get()
+        cpu.registradores.read(30, pc)
+        cpu._pc_set(controlador.vetor)
+        controlador.habilitado = False
+        self.interrupcoes += 1
+        if cpu.verbose:
+            print(f"    > [INT] Pendentes={controlador.pendentes:b}: R30 <- {pc}, PC <- {controlador.vetor}")
+
+    def _verificar_laco_ocioso(self, max_tempo):
+        cpu = self.cpu
+        flags = cpu.flags
+        assinatura = (cpu._pc_get(), tuple(cpu.registradores.regs),
+                      flags.neg, flags.zero, flags.carry, flags.overflow,
+                      self.controlador.habilitado, self.controlador.ativacao)
+        marca = (self.barramento.escritas, self.barramento.leituras_volateis,
+                 self.eventos_disparados, self.interrupcoes)
+        anterior, self._volta = self._volta, (assinatura, marca, self.tempo)
+        if anterior is None or anterior[0] != assinatura or anterior[1] != marca:
+            return
+
+        periodo = self.tempo - anterior[2]
+        alvo = min(self.fila[0][0], max_tempo) if self.fila else max_tempo
+        voltas = (alvo - self.tempo) // periodo
+        if voltas <= 0:
+            return
+        self.tempo += voltas * periodo
+        self.instrucoes_puladas += voltas * periodo
+        self.lacos_ociosos += 1
+        self._volta = (assinatura, marca, self.tempo)
+        if cpu.verbose:
+            print(f"    > [OCIOSO] Laço em PC={assinatura[0]}: {voltas} voltas puladas até t={self.tempo}")
+
+    def get_stats(self):
+        return (f"Escalonador - Tempo: {self.tempo}, Instruções: {self.instrucoes}, "
+                f"Puladas em laços ociosos: {self.instrucoes_puladas} ({self.lacos_ociosos} saltos), "
+                f"Eventos: {self.eventos_disparados}, Interrupções: {self.interrupcoes}")
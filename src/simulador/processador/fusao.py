@@ -0,0 +1,212 @@
+# src/simulador/processador/fusao.py
+
+# ------------------------------
+# Fusão de Instruções (Superinstruções)
+# ------------------------------
+# Reconhece, na decodificação, pares de instruções muito comuns nos nossos programas e os
+# executa como uma única operação, economizando o despacho (fetch/decode/if-chain) da segunda:
+#   "constante" -> lcl_msb + lcl_lsb (ou o inverso) no mesmo registrador: monta 32 bits de uma vez
+#   "laco"      -> inc/dec seguido de beq/bne/bgt/blt: contador + desvio do fim do laço
+#   "load_alu"  -> load seguido de add/sub/xor/or/and
+#
+# Os pares decodificados ficam guardados por PC junto com as palavras que os originaram.
+# Antes de executar um par, as duas palavras buscadas na cache de instruções são comparadas
+# com as guardadas: se um STORE alterou o par, ele é decodificado de novo. Um desvio para a
+# segunda instrução do par cai em outro PC e, portanto, executa normalmente.
+# Com um depurador anexado, um par que esconderia um breakpoint (ou atrasaria a parada de um
+# watchpoint) também executa como duas instruções simples. O mesmo vale, com um escalonador,
+# para um par que atravessaria um evento ou a entrega de uma interrupção.
+
+LCL_MSB, LCL_LSB = 14, 15
+LOAD = 16
+INC, DEC = 27, 28
+BEQ, BNE, BGT, BLT = 20, 21, 29, 30
+
+DESVIOS = {BEQ, BNE, BGT, BLT}
+ALU_FUSIVEIS = {1: 'add', 2: 'sub', 4: 'xor', 5: 'or', 7: 'and'}
+
+# Opcodes que podem iniciar um par (evita decodificar a segunda palavra à toa)
+PRIMEIRAS = {LCL_MSB, LCL_LSB, LOAD, INC, DEC}
+
+TIPOS = ("constante", "laco", "load_alu")
+
+
+def _campos(palavra):
+    """Separa a palavra nos campos usados pelo decodificador: (opcode, ra, rb, rc, const16)."""
+    return ((palavra >> 24) & 0xFF, (palavra >> 16) & 0xFF, (palavra >> 8) & 0xFF,
+            palavra & 0xFF, (palavra >> 8) & 0xFFFF)
+
+
+def classificar_par(palavra1, palavra2):
+    """Retorna o tipo de fusão aplicável ao par de palavras, ou None se não forem fusíveis."""
+    op1, _, _, rc1, _ = _campos(palavra1)
+    op2, _, _, rc2, _ = _campos(palavra2)
+
+    if {op1, op2} == {LCL_MSB, LCL_LSB} and rc1 == rc2 and rc1 < 32:
+        return "constante"
+    if op1 in (INC, DEC) and op2 in DESVIOS:
+        return "laco"
+    if op1 == LOAD and op2 in ALU_FUSIVEIS:
+        return "load_alu"
+    return None
+
+
+class FusorInstrucoes:
+    def __init__(self):
+        # PC -> (palavra1, palavra2, tipo, campos1, campos2, dec2); tipo None = não fusível
+        self.pares = {}
+        self.pares_executados = 0
+        self.por_tipo = {tipo: 0 for tipo in TIPOS}
+
+    @property
+    def instrucoes_fundidas(self):
+        """Instruções dinâmicas executadas dentro de pares fundidos."""
+        return 2 * self.pares_executados
+
+    def limpar(self):
+        """Descarta os pares decodificados (ex.: ao carregar um novo programa)."""
+        self.pares.clear()
+
+    def pre_decodificar(self, memoria, enderecos):
+        """Decodifica antecipadamente os pares que começam nos endereços dados (ex.: código alcançável do CFG)."""
+        for pc in enderecos:
+            self.pares[pc] = self._decodificar_em(memoria, pc, memoria.load(pc))
+
+    def _decodificar_em(self, memoria, pc, palavra):
+        """Decodifica o par em `pc`, espiando a próxima palavra direto na RAM (sem afetar as estatísticas da cache)."""
+        segunda = None
+        if (palavra >> 24) & 0xFF in PRIMEIRAS and pc + 1 < len(memoria.dados):
+            segunda = memoria.load(pc + 1)
+        return self._decodificar_par(palavra, segunda)
+
+    def _decodificar_par(self, palavra1, palavra2):
+        tipo = classificar_par(palavra1, palavra2) if palavra2 is not None else None
+        campos2 = _campos(palavra2) if tipo else None
+        campos1 = _campos(palavra1)
+        dec2 = None
+        if tipo:
+            # Resultado devolvido ao laço de execução: descreve a última instrução do par
+            # ('opcode_primeira' permite contar o mix de instruções sem perder a primeira)
+            dec2 = {'opcode': campos2[0], 'ra_idx': campos2[1], 'rb_idx': campos2[2],
+                    'rc_idx': campos2[3], 'instrucoes': 2, 'fusao': tipo, 'opcode_primeira': campos1[0]}
+        return (palavra1, palavra2, tipo, campos1, campos2, dec2)
+
+    # ------------------------------
+    # Execução
+    # ------------------------------
+    def executar_passo(self, cpu):
+        """Substitui Processador.executar_passo: executa um par fundido ou uma instrução simples."""
+        pc = cpu._pc_get()
+        palavra = cpu.cache_instrucoes.load(pc)
+
+        entrada = self.pares.get(pc)
+        if entrada is None or entrada[0] != palavra:
+            entrada = self.pares[pc] = self._decodificar_em(cpu.memoria, pc, palavra)
+
+        if (entrada[2] is None
+                or (cpu.depurador is not None and not cpu.depurador.permite_fusao(pc, entrada[2]))
+                or (cpu.escalonador is not None and not cpu.escalonador.permite_fusao())):
+            return self._executar_simples(cpu, pc, palavra)
+
+        segunda = cpu.cache_instrucoes.load(pc + 1)
+        if segunda != entrada[1]:
+            # O par foi modificado desde a decodificação: decodifica de novo com o que foi buscado
+            entrada = self.pares[pc] = self._decodificar_par(palavra, segunda)
+            if entrada[2] is None:
+                primeira = self._executar_simples(cpu, pc, palavra)
+                return dict(self._executar_simples(cpu, pc + 1, segunda), instrucoes=2,
+                            opcode_primeira=primeira['opcode'])
+
+        cpu._ir_set(segunda)
+        cpu._pc_set(pc + 2)
+        tipo = entrada[2]
+        if tipo == "constante":
+            self._constante(cpu, entrada[3], entrada[4])
+        elif tipo == "laco":
+            self._laco(cpu, entrada[3], entrada[4])
+        else:
+            self._load_alu(cpu, pc, entrada[3], entrada[4])
+
+        self.pares_executados += 1
+        self.por_tipo[tipo] += 1
+        if cpu.verbose:
+            print(f"    > [FUSÃO] {tipo} em PC={pc}")
+        return entrada[5]
+
+    @staticmethod
+    def _executar_simples(cpu, pc, palavra):
+        """Caminho normal (IF/ID/EX) para uma instrução já buscada."""
+        cpu._ir_set(palavra)
+        dec = cpu.decodificar()
+        cpu._pc_set((pc + 1) & 0xFFFFFFFF)
+        cpu.executar_instrucao(dec)
+        return dec
+
+    @staticmethod
+    def _ler(cpu, indice):
+        """Leitura de registrador com a mesma regra do decodificador (índice >= 32 lê 0)."""
+        return cpu.registradores.load(indice) if indice < 32 else 0
+
+    def _constante(self, cpu, campos1, campos2):
+        op1, _, _, rc, c1 = campos1
+        c2 = campos2[4]
+        alta, baixa = (c1, c2) if op1 == LCL_MSB else (c2, c1)
+        cpu.registradores.read(rc, ((alta << 16) & 0xFFFF0000) | (baixa & 0xFFFF))
+
+    def _laco(self, cpu, campos1, campos2):
+        op1, ra1, _, rc1, _ = campos1
+        op2, ra2, rb2, rc2, _ = campos2
+
+        valor = self._ler(cpu, ra1)
+        if op1 == INC:
+            res = valor + 1
+            cpu._atualizar_flags(res, valor, 1, 'add')
+        else:
+            res = valor - 1
+            cpu._atualizar_flags(res, valor, 1, 'sub')
+        if rc1 < 32:
+            cpu.registradores.read(rc1, res)
+
+        a, b = self._ler(cpu, ra2), self._ler(cpu, rb2)
+        if op2 == BNE:
+            desviar = a != b
+        elif op2 == BLT:
+            desviar = a < b
+        elif op2 == BEQ:
+            desviar = a == b
+        else:
+            desviar = a > b
+        if desviar:
+            cpu._pc_set(rc2)
+
+    def _load_alu(self, cpu, pc, campos1, campos2):
+        _, ra1, _, rc1, _ = campos1
+        op2, ra2, rb2, rc2, _ = campos2
+
+        valor = cpu.cache_dados.load(self._ler(cpu, ra1), pc)
+        if rc1 < 32:
+            cpu.registradores.read(rc1, valor)
+
+        a, b = self._ler(cpu, ra2), self._ler(cpu, rb2)
+        operacao = ALU_FUSIVEIS[op2]
+        if operacao == 'add':
+            res = a + b
+        elif operacao == 'sub':
+            res = a - b
+        elif operacao == 'xor':
+            res = a ^ b
+        elif operacao == 'or':
+            res = a | b
+        else:
+            res = a & b
+        if operacao in ('add', 'sub'):
+            cpu._atualizar_flags(res, a, b, operacao)
+        else:
+            cpu._atualizar_flags(res, 0, 0, 'logic')
+        if rc2 < 32:
+            cpu.registradores.read(rc2, res)
+
+    def get_stats(self):
+        detalhes = ", ".join(f"{tipo}: {n}" for tipo, n in self.por_tipo.items())
+        return (f"Fusão - Pares executados: {self.pares_executados}, "
+                f"Instruções fundidas: {self.instrucoes_fundidas} ({detalhes})")
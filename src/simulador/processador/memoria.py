@@ -1,14 +1,54 @@
 class Memoria: #Representação da RAM
     def __init__(self):
         self.dados = [0] * 65536 #2^16 endereços: cada posição representa uma palavra de 32 bits
+        self.sujas = set()       #Endereços escritos desde a imagem inicial (relatórios e diffs custam só o que foi escrito)
+        self.imagem_inicial = {} #Valores das palavras escritas antes de marcar_imagem_inicial (ex.: o programa carregado)
 
     def load(self, endereco):
         return self.dados[endereco] #retorna o valor armazenado nessa posição da memória
-    
+
     def store(self, endereco, valor):
         self.dados[endereco] = valor & 0xFFFFFFFF #   = 1111 1111 1111 1111 1111 1111 1111 1111  (32 bits 1)
                                                   # & = E bit a bit -> Só deixa o bit como 1 se ele for 1 nos dois números
                                                   # Máscara garante que o número 'valor' não tenha mais do que 32 bits
+        self.sujas.add(endereco) #Marca a palavra como modificada (depois da escrita: endereço inválido não é marcado)
+
+    def marcar_imagem_inicial(self):
+        """Acrescenta as palavras escritas até agora à imagem inicial e limpa as marcas de modificação."""
+        self.imagem_inicial.update({e: self.dados[e] for e in self.sujas}) #Marcações anteriores continuam valendo
+        self.sujas = set()
+
+    def palavras_modificadas(self):
+        """Itera (endereço, valor) das palavras escritas desde a imagem inicial, em ordem de endereço."""
+        for endereco in sorted(self.sujas):
+            yield endereco, self.dados[endereco]
+
+    def diff(self):
+        """{endereço: (valor inicial, valor atual)} das palavras escritas cujo valor realmente mudou."""
+        diferencas = {}
+        for endereco, valor in self.palavras_modificadas():
+            antes = self.imagem_inicial.get(endereco, 0)
+            if antes != valor:
+                diferencas[endereco] = (antes, valor)
+        return diferencas
 
+    def checkpoint(self):
+        """Fotografia das palavras modificadas: custa o que foi escrito, não os 65536 endereços."""
+        return dict(self.palavras_modificadas())
 
+    def restaurar(self, checkpoint):
+        """Volta a memória ao estado de um checkpoint tirado após a mesma imagem inicial."""
+        for endereco in self.sujas - checkpoint.keys():
+            self.dados[endereco] = self.imagem_inicial.get(endereco, 0)
+        for endereco, valor in checkpoint.items():
+            self.dados[endereco] = valor
+        self.sujas = set(checkpoint)
 
+    def __deepcopy__(self, memo):
+        #Palavras são inteiros imutáveis: copiar a lista já é uma cópia profunda (e muito mais rápida)
+        copia = Memoria.__new__(Memoria)
+        copia.dados = list(self.dados)
+        copia.sujas = set(self.sujas)
+        copia.imagem_inicial = dict(self.imagem_inicial)
+        memo[id(self)] = copia
+        return copia
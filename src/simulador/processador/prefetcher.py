@@ -0,0 +1,146 @@
+# src/simulador/processador/prefetcher.py
+
+# ------------------------------
+# Modelos de Prefetch de Hardware
+# ------------------------------
+# Um prefetcher é ligado a uma CacheL1 (cache.prefetcher) e só decide QUAIS endereços buscar:
+#   observar(endereco, pc, evento) -> endereços a emitir
+# onde `evento` é "hit", "miss", "util" (1º uso de uma linha que chegou por prefetch) ou
+# "atrasado" (1º uso de uma linha ainda a caminho). A cache filtra o que já está presente ou
+# pendente, modela a latência e conta prefetches úteis, atrasados e inúteis.
+#
+# Como a CacheL1 não tem capacidade nem linhas maiores que uma palavra, "linha" aqui é uma
+# palavra e o prefetch só pode eliminar misses compulsórios; prefetches inúteis custam banda,
+# não poluição.
+
+class PrefetcherProximaLinha:
+    nome = "next-line"
+
+    def __init__(self, grau=4):
+        """
+        Prefetch "tagged": um miss, ou o 1º uso de uma linha trazida por prefetch, busca as próximas `grau` linhas.
+        """
+        self.grau = grau
+
+    def observar(self, endereco, pc, evento):
+        if evento == "hit":
+            return ()
+        return range(endereco + 1, endereco + 1 + self.grau)
+
+
+class PrefetcherStride:
+    nome = "stride"
+
+    def __init__(self, grau=4, entradas=64):
+        """
+        Tabela indexada pelo PC do load: detecta passo constante entre acessos da mesma instrução.
+        :param grau: Quantos passos à frente buscar quando o passo se confirma
+        :param entradas: Tamanho da tabela (a entrada mais antiga é substituída)
+        """
+        self.grau = grau
+        self.entradas = entradas
+        self.tabela = {}    # PC -> [último endereço, passo, confiança]
+
+    def observar(self, endereco, pc, evento):
+        if pc is None:
+            return ()   # Sem PC (ex.: busca de instruções) não há o que treinar
+        entrada = self.tabela.get(pc)
+        if entrada is None:
+            if len(self.tabela) >= self.entradas:
+                del self.tabela[next(iter(self.tabela))]
+            self.tabela[pc] = [endereco, 0, 0]
+            return ()
+
+        passo = endereco - entrada[0]
+        if passo == entrada[1] and passo != 0:
+            entrada[2] = min(entrada[2] + 1, 3)
+        else:
+            entrada[1] = passo
+            entrada[2] = 0
+        entrada[0] = endereco
+        if entrada[2] == 0:
+            return ()
+        return [endereco + passo * k for k in range(1, self.grau + 1)]
+
+
+class PrefetcherStreamBuffers:
+    nome = "stream"
+
+    def __init__(self, buffers=4, profundidade=4):
+        """
+        Stream buffers: cada miss fora dos fluxos conhecidos aloca um fluxo sequencial (substituindo
+        o menos usado) e busca `profundidade` linhas à frente; o uso de uma linha do fluxo o avança.
+        As linhas ficam nos prefetches pendentes da cache, e não em buffers separados.
+        """
+        self.buffers = buffers
+        self.profundidade = profundidade
+        self.fluxos = []    # [próxima esperada, fim já emitido]; o último é o usado mais recentemente
+
+    def observar(self, endereco, pc, evento):
+        if evento == "hit":
+            return ()
+        for i, fluxo in enumerate(self.fluxos):
+            if fluxo[0] <= endereco < fluxo[1]:
+                self.fluxos.append(self.fluxos.pop(i))
+                inicio, fluxo[0], fluxo[1] = fluxo[1], endereco + 1, endereco + 1 + self.profundidade
+                return range(inicio, fluxo[1])
+        if len(self.fluxos) >= self.buffers:
+            self.fluxos.pop(0)
+        self.fluxos.append([endereco + 1, endereco + 1 + self.profundidade])
+        return range(endereco + 1, endereco + 1 + self.profundidade)
+
+
+PREFETCHERS = {
+    PrefetcherProximaLinha.nome: PrefetcherProximaLinha,
+    PrefetcherStride.nome: PrefetcherStride,
+    PrefetcherStreamBuffers.nome: PrefetcherStreamBuffers,
+}
+
+
+def criar_prefetcher(tipo, **parametros):
+    if tipo not in PREFETCHERS:
+        raise ValueError(f"Prefetcher desconhecido: {tipo!r} (use {', '.join(PREFETCHERS)})")
+    return PREFETCHERS[tipo](**parametros)
+
+
+# ------------------------------
+# Comparação do Efeito na Taxa de Miss
+# ------------------------------
+
+def comparar_prefetchers(caminho_programa_bin, tipos=None, max_instrucoes=1000000, latencia=4):
+    """
+    Executa o programa uma vez sem prefetch e uma vez com cada tipo, e retorna uma linha por
+    (tipo, cache): {'prefetcher', 'cache', 'hits', 'misses', 'taxa_miss', 'reducao',
+    'uteis', 'atrasados', 'inuteis'}. `reducao` é a queda relativa de misses frente à base.
+    """
+    from .processador_main import Processador
+
+    linhas = []
+    base = {}
+    for tipo in [None] + list(PREFETCHERS if tipos is None else tipos):
+        cpu = Processador(caminho_programa_bin, verbose=False, prefetch=tipo)
+        for cache in (cpu.cache_instrucoes, cpu.cache_dados):
+            cache.latencia_prefetch = latencia
+        cpu.executar_silencioso(max_instrucoes)
+
+        for cache in (cpu.cache_instrucoes, cpu.cache_dados):
+            if tipo is None:
+                base[cache.nome] = cache.misses
+            misses_base = base[cache.nome]
+            linhas.append({
+                'prefetcher': tipo or "nenhum", 'cache': cache.nome,
+                'hits': cache.hits, 'misses': cache.misses, 'taxa_miss': cache.taxa_miss,
+                'reducao': 1 - cache.misses / misses_base if misses_base else 0.0,
+                'uteis': cache.prefetch_uteis, 'atrasados': cache.prefetch_atrasados,
+                'inuteis': cache.prefetch_inuteis,
+            })
+    return linhas
+
+
+def formatar_comparacao(linhas):
+    texto = [f"{'Prefetcher':<10} {'Cache':<14} {'Misses':>8} {'Taxa':>7} {'Redução':>8} "
+             f"{'Úteis':>7} {'Atras.':>7} {'Inúteis':>8}"]
+    for l in linhas:
+        texto.append(f"{l['prefetcher']:<10} {l['cache']:<14} {l['misses']:>8} {l['taxa_miss']:>7.2%} "
+                     f"{l['reducao']:>8.1%} {l['uteis']:>7} {l['atrasados']:>7} {l['inuteis']:>8}")
+    return "\n".join(texto)
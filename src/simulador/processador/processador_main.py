@@ -8,10 +8,15 @@ from .ir import IR
 from .flags import Flags
 # Nova importação
 from .cache import CacheL1 
+# Módulos opcionais (fusão, prefetch, amostragem) são importados sob demanda para manter a inicialização leve
 
 class Processador:
-    def __init__(self, caminho_programa_bin: str = None):
+    def __init__(self, caminho_programa_bin: str = None, verbose: bool = True, fusao: bool = False,
+                 prefetch: str = None):
         # Inicializa a estrutura física do processador simulado
+
+        # Controla os logs ciclo a ciclo (desligado em execuções silenciosas, ex.: co-simulação)
+        self.verbose = verbose
         
         # Instancia a memória principal (RAM)
         self.memoria = Memoria()
@@ -20,12 +25,28 @@ class Processador:
         # Ambas são "backed" pela mesma RAM (self.memoria), mas operam independentemente
         self.cache_instrucoes = CacheL1(self.memoria, nome="L1 Instruções")
         self.cache_dados = CacheL1(self.memoria, nome="L1 Dados")
+        # Prefetch de hardware opcional ("next-line", "stride" ou "stream"), um modelo por cache
+        if prefetch is not None:
+            from .prefetcher import criar_prefetcher
+            self.cache_instrucoes.prefetcher = criar_prefetcher(prefetch)
+            self.cache_dados.prefetcher = criar_prefetcher(prefetch)
         # ----------------------------------------------
 
         self.registradores = Registradores() 
         self.pc = PC()                       
         self.ir = IR()                       
         self.flags = Flags()                 
+
+        # Fusão de pares de instruções comuns (superinstruções); desligada por padrão
+        self.fusor = None
+        if fusao:
+            from .fusao import FusorInstrucoes
+            self.fusor = FusorInstrucoes()
+
+        # Breakpoints/watchpoints: anexado por depuracao.Depurador(cpu); None = nenhum custo de verificação
+        self.depurador = None
+        # Tempo, dispositivos e interrupções: anexado por eventos.Escalonador(cpu)
+        self.escalonador = None
         
         if caminho_programa_bin:
             self.carregar_programa(caminho_programa_bin)
@@ -55,12 +76,17 @@ class Processador:
         # O Loader continua escrevendo direto na RAM (o que é correto, simula I/O de disco)
         # As caches estarão frias (vazias) e buscarão os dados sob demanda.
         endereco_inicio = loader.carregar_na_memoria(self.memoria)
+        # O programa carregado passa a ser a imagem inicial: daqui em diante só as escritas da execução são "sujas"
+        self.memoria.marcar_imagem_inicial()
+        if self.fusor is not None:
+            self.fusor.limpar()
         
         self._pc_set(endereco_inicio) 
         
-        print(f"✓ Programa carregado na memória principal")
-        print(f"✓ Endereço inicial (PC): {endereco_inicio:08b}")
-        print(f"✓ Total de instruções: {len(loader.instrucoes)}")
+        if self.verbose:
+            print(f"✓ Programa carregado na memória principal")
+            print(f"✓ Endereço inicial (PC): {endereco_inicio:08b}")
+            print(f"✓ Total de instruções: {len(loader.instrucoes)}")
 
     def _atualizar_flags(self, resultado, op1, op2, operacao):
         # ... (Método permanece inalterado) ...
@@ -199,20 +225,22 @@ class Processador:
 
         # --- AQUI ESTÁ A MUDANÇA PARA DADOS ---
         elif op == 16: # Instrução LOAD (Memória -> Registrador)
-            # Lê da Cache L1 de Dados
-            wb_result = self.cache_dados.load(val_ra)
+            # Lê da Cache L1 de Dados (o PC da instrução treina prefetchers por instrução)
+            wb_result = self.cache_dados.load(val_ra, self._pc_get() - 1)
             realizar_wb = True
             
         elif op == 17: # Instrução STORE (Registrador -> Memória)
             # Escreve na Cache L1 de Dados (que escreverá na RAM)
             self.cache_dados.store(self.registradores.load(rc), val_ra)
-            print(f"    > [MEM/Cache] Endereço {self.registradores.load(rc)} <- {val_ra}")
+            if self.verbose:
+                print(f"    > [MEM/Cache] Endereço {self.registradores.load(rc)} <- {val_ra}")
         # --------------------------------------
 
         elif op == 18: # JAL
             pc_ret = self._pc_get()
             self.registradores.read(31, pc_ret)
-            print(f"    > [WB] JAL: R31 <- {pc_ret}")
+            if self.verbose:
+                print(f"    > [WB] JAL: R31 <- {pc_ret}")
             self._pc_set(end24)
         elif op == 19: # JR
             self._pc_set(self.registradores.load(rc))
@@ -261,11 +289,15 @@ class Processador:
         # Write Back
         if realizar_wb and wb_destino < 32:
             self.registradores.read(wb_destino, wb_result)
-            print(f"    > [WB] R{wb_destino} <- {wb_result}")
+            if self.verbose:
+                print(f"    > [WB] R{wb_destino} <- {wb_result}")
 
     def executar_passo(self):
         # ... (Inalterado) ...
         if self.parado: return False
+        if self.fusor is not None:
+            # O fusor faz o ciclo completo: par fundido (2 instruções) ou instrução simples
+            return self.fusor.executar_passo(self)
         self.buscar_instrucao()
         dec = self.decodificar()
         pc_atual = self._pc_get()
@@ -273,28 +305,94 @@ class Processador:
         self.executar_instrucao(dec)
         return dec
 
-    def executar_programa(self):
-        # ... (Pequena adição para mostrar status das caches no final, se desejar) ...
-        print("\n=== Iniciando execução ===\n")
+    def executar_silencioso(self, max_instrucoes: int, contagem: dict = None) -> int:
+        """
+        Executa até HALT ou `max_instrucoes` instruções retiradas (um par fundido conta 2), sem o
+        relatório de executar_programa. Retorna quantas instruções foram retiradas.
+        :param contagem: Opcional; acumula as instruções por opcode (as duas de um par fundido)
+        """
+        executadas = 0
+        while executadas < max_instrucoes and not self.parado:
+            res = self.executar_passo()
+            if not res:
+                break
+            executadas += res.get('instrucoes', 1)
+            if contagem is not None:
+                contagem[res['opcode']] = contagem.get(res['opcode'], 0) + 1
+                if 'opcode_primeira' in res:
+                    contagem[res['opcode_primeira']] = contagem.get(res['opcode_primeira'], 0) + 1
+            if res['opcode'] == 255:
+                self.parado = True
+        return executadas
+
+    def executar_programa(self, max_ciclos: int = 1000, amostragem=None):
+        """
+        Executa até HALT ou `max_ciclos` instruções.
+        Com `amostragem` (ConfigAmostragem), alterna avanço funcional rápido e janelas
+        detalhadas, e retorna o ResultadoAmostragem com CPI e taxas de miss estimados.
+        Com um Depurador anexado, para no primeiro breakpoint/watchpoint e retorna a Parada
+        (chamar de novo retoma a execução a partir dela).
+        Com um Escalonador anexado, `max_ciclos` limita o tempo simulado (incluindo as voltas de
+        laços ociosos puladas) e a execução passa a disparar eventos e entregar interrupções.
+        """
+        if amostragem is not None:
+            from .amostragem import executar_amostrado
+            resultado = executar_amostrado(self, amostragem, max_ciclos)
+            if not self.parado:
+                print("⚠ Limite de ciclos atingido!")
+            print(resultado)
+            self.estado()
+            return resultado
+
+        if self.verbose:
+            print("\n=== Iniciando execução ===\n")
+        if self.escalonador is not None:
+            inicio = self.escalonador.instrucoes
+            parada = None
+            try:
+                parada = self.escalonador.executar(max_ciclos)
+            except Exception as e:
+                print(f"✗ Erro na execução: {e}")
+            if parada is not None:
+                print(f"⏸ {parada.concluir(self, self.escalonador.instrucoes - inicio)}")
+            elif self.escalonador.tempo >= max_ciclos:
+                print("⚠ Limite de tempo atingido!")
+            self.estado()
+            return parada
+
         ciclo = 0
-        while not self.parado and ciclo < 1000:
+        depurador = self.depurador
+        parada = None
+        while not self.parado and ciclo < max_ciclos:
             try:
+                if depurador is not None:
+                    parada = depurador.antes_do_passo()
+                    if parada is not None:
+                        break
                 res = self.executar_passo()
                 if res and res['opcode'] == 255: 
-                    print(f"Ciclo {ciclo}: HALT encontrado.")
+                    if self.verbose:
+                        print(f"Ciclo {ciclo}: HALT encontrado.")
                     self.parado = True
                     break
-                elif res:
+                elif res and self.verbose:
                     print(f"Ciclo {ciclo}: Opcode={res['opcode']:02x} PC={self._pc_get():04x}")
-                ciclo += 1
+                ciclo += res.get('instrucoes', 1) if res else 1
+                if depurador is not None:
+                    parada = depurador.depois_do_passo()
+                    if parada is not None:
+                        break
             except Exception as e:
                 print(f"✗ Erro na execução: {e}")
                 break
         
-        if ciclo >= 1000:
+        if parada is not None:
+            print(f"⏸ {parada.concluir(self, ciclo)}")
+        elif ciclo >= max_ciclos:
             print("⚠ Limite de ciclos atingido!")
         
         self.estado()
+        return parada
 
     def estado(self):
         # ... (Exibição normal dos registradores) ...
@@ -305,6 +403,10 @@ class Processador:
         print("\n--- Estatísticas das Caches ---")
         print(self.cache_instrucoes.get_stats())
         print(self.cache_dados.get_stats())
+        if self.fusor is not None:
+            print(self.fusor.get_stats())
+        if self.escalonador is not None:
+            print(self.escalonador.get_stats())
 
         print("\n--- Registradores ---")
         tem_valor = False
@@ -313,4 +415,11 @@ class Processador:
                 print(f"R{i:<2}: {valor:<10} (Hex: 0x{valor:X})")
                 tem_valor = True
         if not tem_valor:
-            print("(Todos os registradores estão zerados)")
\ No newline at end of file
+            print("(Todos os registradores estão zerados)")
+
+        print("\n--- Memória Modificada ---")
+        diferencas = self.memoria.diff()
+        for endereco, (antes, valor) in diferencas.items():
+            print(f"Mem[{endereco}]: {valor:<10} (Hex: 0x{valor:X}) | Antes: {antes}")
+        if not diferencas:
+            print("(Nenhuma palavra da memória foi modificada)")
\ No newline at end of file
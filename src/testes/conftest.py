@@ -0,0 +1,20 @@
+import sys
+import os
+import pytest
+
+# Garante que a pasta `src` esteja no caminho de import
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from interpretador.interpretador import montar_arquivo_assembly
+
+
+@pytest.fixture
+def montar(tmp_path):
+    """Monta um texto Assembly em tmp_path e devolve o caminho do .bin: montar(texto, nome="programa")."""
+    def _montar(texto, nome="programa"):
+        asm = tmp_path / f"{nome}.asm"
+        asm.write_text(texto)
+        bin_ = tmp_path / f"{nome}.bin"
+        montar_arquivo_assembly(str(asm), str(bin_))
+        return str(bin_)
+    return _montar
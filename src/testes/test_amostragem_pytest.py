@@ -0,0 +1,92 @@
+import sys
+import os
+import pytest
+
+# Garante que a pasta `src` esteja no caminho de import
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from simulador.processador.processador_main import Processador
+from simulador.processador.amostragem import ConfigAmostragem
+
+# Percorre 5000 palavras a partir de Mem[1000], somando em r5 (25005 instruções dinâmicas)
+PROGRAMA_STREAM = """
+lcl_msb r2, 0
+lcl_lsb r2, 5000    ; N
+lcl_lsb r3, 1000    ; ponteiro
+zeros r1
+load r4, r3         ; 4 (início do laço)
+add r5, r5, r4
+inc r3, r3
+inc r1, r1
+bne r1, r2, 4
+halt
+"""
+
+
+@pytest.fixture
+def programa_bin(montar):
+    return montar(PROGRAMA_STREAM, "stream")
+
+
+def test_config_invalida():
+    with pytest.raises(ValueError):
+        ConfigAmostragem(periodo=100, janela=80, aquecimento=30)
+    with pytest.raises(ValueError):
+        ConfigAmostragem(janela=0)
+
+
+def test_amostragem_estima_cpi_do_programa_completo(programa_bin):
+    config = ConfigAmostragem(periodo=2500, janela=500, aquecimento=200, penalidade_miss=10)
+
+    detalhado = Processador(programa_bin, verbose=False)
+    detalhado.executar_programa(max_ciclos=100000)
+    misses = detalhado.cache_instrucoes.misses + detalhado.cache_dados.misses
+    cpi_real = (25005 + config.penalidade_miss * misses) / 25005
+
+    amostrado = Processador(programa_bin, verbose=False)
+    resultado = amostrado.executar_programa(max_ciclos=100000, amostragem=config)
+
+    # Mesmo resultado funcional
+    assert amostrado.parado
+    assert amostrado.registradores.regs == detalhado.registradores.regs
+    assert resultado.instrucoes == 25005
+
+    # Só as janelas (e o aquecimento) passam pelas caches
+    assert len(resultado.janelas) == 10
+    acessos_dados = amostrado.cache_dados.hits + amostrado.cache_dados.misses
+    assert acessos_dados < (detalhado.cache_dados.hits + detalhado.cache_dados.misses) / 3
+
+    assert resultado.cpi.margem is not None
+    assert abs(resultado.cpi.media - cpi_real) < 0.05
+    assert abs(resultado.taxa_miss_dados.media - 1.0) < 0.01
+
+
+def test_caches_restauradas_apos_amostragem(programa_bin):
+    cpu = Processador(programa_bin, verbose=False)
+    cache_i, cache_d = cpu.cache_instrucoes, cpu.cache_dados
+    cpu.executar_programa(max_ciclos=3000, amostragem=ConfigAmostragem(periodo=1000, janela=100, aquecimento=0))
+
+    assert not cpu.parado
+    assert cpu.cache_instrucoes is cache_i and cpu.cache_dados is cache_d
+
+
+def test_execucao_mais_curta_que_um_periodo_tem_janela(programa_bin):
+    # Avanço de 8500 instruções > limite: a parte detalhada vem antes do avanço
+    cpu = Processador(programa_bin, verbose=False)
+    resultado = cpu.executar_programa(max_ciclos=3000, amostragem=ConfigAmostragem())
+
+    assert len(resultado.janelas) == 1 and resultado.janelas[0]['instrucoes'] == 1000
+    assert resultado.cpi.media > 1.0
+    assert resultado.ciclos_estimados == resultado.cpi.media * 3000
+
+
+def test_sem_janelas_metricas_indisponiveis(programa_bin, capsys):
+    # O programa termina (25005 instruções) ainda no aquecimento
+    cpu = Processador(programa_bin, verbose=False)
+    config = ConfigAmostragem(periodo=100000, janela=1000, aquecimento=30000)
+    resultado = cpu.executar_programa(max_ciclos=100000, amostragem=config)
+
+    assert cpu.parado and resultado.janelas == []
+    assert resultado.cpi.media is None and resultado.ciclos_estimados is None
+    saida = capsys.readouterr().out
+    assert "CPI estimado: indisponível" in saida and "Ciclos estimados: indisponível" in saida
@@ -0,0 +1,109 @@
+import sys
+import os
+import json
+import pytest
+
+# Garante que a pasta `src` esteja no caminho de import
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from simulador.processador.processador_main import Processador
+from simulador.cfg import GrafoFluxoControle
+
+# Laço que chama uma função três vezes, seguido de código morto
+PROGRAMA = """
+address 0
+lcl_lsb r1, 0       ; 0
+lcl_lsb r2, 3       ; 1
+jal 8               ; 2  (início do laço)
+inc r1, r1          ; 3
+bne r1, r2, 2       ; 4
+halt                ; 5
+add r9, r9, r9      ; 6  inalcançável
+add r9, r9, r9      ; 7  inalcançável
+lcl_lsb r5, 1       ; 8  função
+jr r31              ; 9
+"""
+
+
+@pytest.fixture
+def programa_bin(montar):
+    return montar(PROGRAMA, "cfg")
+
+
+def test_blocos_basicos(programa_bin):
+    cfg = GrafoFluxoControle.de_arquivo_bin(programa_bin)
+
+    assert sorted(cfg.blocos) == [0, 2, 3, 5, 8]
+    assert cfg.blocos[0].sucessores == [2]
+    assert cfg.blocos[2].tipo_saida == "chamada"
+    assert cfg.blocos[2].sucessores == [3] and cfg.blocos[2].chamadas == [8]
+    assert cfg.blocos[3].sucessores == [2, 5]
+    assert cfg.blocos[5].tipo_saida == "halt"
+    assert cfg.blocos[8].tipo_saida == "retorno"
+    assert cfg.avisos == []
+
+
+def test_funcoes_lacos_e_codigo_inalcancavel(programa_bin):
+    cfg = GrafoFluxoControle.de_arquivo_bin(programa_bin)
+
+    assert cfg.funcoes == {0: {0, 2, 3, 5}, 8: {8}}
+    assert cfg.grafo_chamadas == {0: {8}, 8: set()}
+    assert [(l['cabeca'], l['blocos']) for l in cfg.lacos] == [(2, [2, 3])]
+    assert cfg.inalcancaveis() == [6, 7]
+    assert cfg.enderecos_alcancaveis() == [0, 1, 2, 3, 4, 5, 8, 9]
+    assert cfg.lacos_de(4) == [2] and cfg.lacos_de(1) == []
+    assert cfg.funcoes_de(9) == [8]
+
+
+def test_lacos_aninhados_do_mais_externo_ao_mais_interno(montar):
+    texto = """
+lcl_lsb r2, 3       ; 0
+zeros r1            ; 1  laço externo
+lcl_lsb r3, 4       ; 2
+inc r1, r1          ; 3  laço interno
+bne r1, r3, 3       ; 4
+dec r2, r2          ; 5
+bne r2, r0, 1       ; 6
+halt                ; 7
+"""
+    cfg = GrafoFluxoControle.de_arquivo_bin(montar(texto, "aninhado"))
+
+    assert cfg.lacos_de(4) == [1, 3]
+    assert cfg.lacos_de(6) == [1]
+    assert cfg.lacos_de(0) == [] and cfg.lacos_de(7) == []
+    assert cfg.lacos_de(1000) == [] and cfg.funcoes_de(1000) == []
+    assert cfg.funcoes_de(4) == [0]
+
+
+def test_exportacao_json_e_dot(programa_bin):
+    cfg = GrafoFluxoControle.de_arquivo_bin(programa_bin)
+
+    dados = json.loads(cfg.para_json())
+    assert dados['inalcancaveis'] == [6, 7]
+    assert dados['blocos'][1]['instrucoes'] == ["jal 8"]
+
+    dot = cfg.para_dot()
+    assert dot.startswith("digraph cfg {")
+    assert "b2 -> b8 [style=dashed];" in dot
+
+
+def test_salto_indireto_e_fora_da_imagem_geram_avisos():
+    # jr r5 (indireto) e j 100 (fora da imagem)
+    cfg = GrafoFluxoControle({0: 0x13000005, 1: 0x16000064}, entrada=0)
+    assert cfg.blocos[0].tipo_saida == "indireto"
+    assert len(cfg.avisos) == 1
+
+    cfg = GrafoFluxoControle({0: 0x16000064}, entrada=0)
+    assert cfg.avisos == ["Salto para o endereço 100, fora da imagem do programa"]
+
+
+def test_pre_aquecimento_do_codigo_alcancavel(programa_bin):
+    cfg = GrafoFluxoControle.de_arquivo_bin(programa_bin)
+    cpu = Processador(programa_bin, verbose=False, fusao=True)
+    cpu.cache_instrucoes.pre_carregar(cfg.enderecos_alcancaveis())
+    cpu.fusor.pre_decodificar(cpu.memoria, cfg.enderecos_alcancaveis())
+    cpu.executar_programa()
+
+    assert cpu.registradores.load(1) == 3
+    assert cpu.cache_instrucoes.misses == 0
+    assert set(cpu.fusor.pares) == set(cfg.enderecos_alcancaveis())
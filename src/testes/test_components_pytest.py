@@ -34,6 +34,51 @@ def test_memoria_out_of_bounds_raises():
         m.store(65536, 0)
 
 
+def test_memoria_palavras_modificadas_e_diff():
+    m = Memoria()
+    m.store(0, 111)     # "programa" carregado
+    m.store(1, 222)
+    m.marcar_imagem_inicial()
+    assert list(m.palavras_modificadas()) == []
+
+    m.store(500, 7)
+    m.store(1, 222)     # escrita sem mudança de valor
+    m.store(0, 5)
+    assert list(m.palavras_modificadas()) == [(0, 5), (1, 222), (500, 7)]
+    assert m.diff() == {0: (111, 5), 500: (0, 7)}
+
+    # Endereço inválido não é marcado como sujo
+    with pytest.raises(IndexError):
+        m.store(65536, 1)
+    assert 65536 not in m.sujas
+
+
+def test_memoria_marcar_imagem_inicial_acumula():
+    m = Memoria()
+    m.store(10, 111)
+    m.marcar_imagem_inicial()
+    m.store(20, 222)
+    m.marcar_imagem_inicial()   # a segunda marcação não esquece Mem[10]
+    m.store(10, 5)
+    assert m.diff() == {10: (111, 5)}
+
+
+def test_memoria_checkpoint_e_restaurar():
+    m = Memoria()
+    m.store(0, 111)
+    m.marcar_imagem_inicial()
+    m.store(10, 1)
+    ponto = m.checkpoint()
+    assert ponto == {10: 1}
+
+    m.store(10, 2)
+    m.store(0, 3)
+    m.store(20, 4)
+    m.restaurar(ponto)
+    assert (m.load(0), m.load(10), m.load(20)) == (111, 1, 0)
+    assert m.sujas == {10}
+
+
 def test_registradores_mask_and_access():
     r = Registradores()
     r.read(0, 0)
@@ -0,0 +1,108 @@
+import sys
+import os
+import pytest
+
+# Garante que a pasta `src` esteja no caminho de import
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from interpretador.interpretador import desmontar_instrucao, montar_instrucao
+from simulador.processador.processador_main import Processador
+from simulador.cosimulacao import CoSimulador
+
+# Laço que grava r1 em Mem[100] e incrementa r1 de 0 até 5
+PROGRAMA_LACO = """
+lcl_lsb r1, 0       ; 0
+lcl_lsb r2, 5       ; 1
+lcl_lsb r3, 100     ; 2
+store r3, r1        ; 3  Mem[100] = r1 (início do laço)
+inc r1, r1          ; 4
+bne r1, r2, 3       ; 5
+halt                ; 6
+"""
+
+
+class ProcessadorIncErrado(Processador):
+    """Motor candidato com defeito: INC de 2 produz 4."""
+
+    def executar_instrucao(self, dec):
+        if dec['opcode'] == 27 and dec['val_ra'] == 2:
+            dec = dict(dec, val_ra=3)
+        return super().executar_instrucao(dec)
+
+
+class ProcessadorStoreErrado(Processador):
+    """Motor candidato com defeito: STORE grava o valor + 1 (só a memória diverge)."""
+
+    def executar_instrucao(self, dec):
+        if dec['opcode'] == 17:
+            dec = dict(dec, val_ra=dec['val_ra'] + 1)
+        return super().executar_instrucao(dec)
+
+
+@pytest.fixture
+def programa_bin(montar):
+    return montar(PROGRAMA_LACO, "laco")
+
+
+def test_desmontar_inverte_montagem():
+    for linha in ["add r3, r1, r2", "zeros r8", "not r9, r8", "lcl_msb r4, 65535",
+                  "store r1, r2", "jal 300", "jr r31", "bne r1, r2, 7", "halt"]:
+        assert desmontar_instrucao(int(montar_instrucao(linha), 2)) == linha
+    assert desmontar_instrucao(0) == ".word 0x00000000"
+
+
+def test_motores_identicos_nao_divergem(programa_bin):
+    cosim = CoSimulador(Processador(programa_bin, verbose=False), Processador(programa_bin, verbose=False))
+    assert cosim.executar() is None
+    assert cosim.passos == 19
+    assert cosim.referencia.parado and cosim.candidato.parado
+
+
+@pytest.mark.parametrize("modo,intervalo", [
+    ("instrucao", 1), ("instrucao", 7), ("bloco", 1), ("bloco", 2), ("hash", 5), ("hash", 1000),
+])
+def test_divergencia_bisseccionada_ate_a_instrucao(programa_bin, modo, intervalo):
+    cosim = CoSimulador(Processador(programa_bin, verbose=False),
+                        ProcessadorIncErrado(programa_bin, verbose=False),
+                        modo=modo, intervalo=intervalo)
+    div = cosim.executar()
+
+    assert div is not None
+    assert div.passo == 11          # Terceira execução do INC
+    assert div.pc == 4
+    assert div.desmontagem == "inc r1, r1"
+    assert any(d.startswith("R1:") for d in div.diferencas)
+
+
+def test_divergencia_somente_na_memoria(programa_bin):
+    cosim = CoSimulador(Processador(programa_bin, verbose=False),
+                        ProcessadorStoreErrado(programa_bin, verbose=False),
+                        modo="instrucao", intervalo=4)
+    div = cosim.executar()
+
+    assert div.passo == 4
+    assert div.desmontagem == "store r3, r1"
+    assert div.diferencas == ["Mem[100]: ref=0 cand=1"]
+
+
+class ProcessadorEscritaExtra(Processador):
+    """Motor candidato com defeito: todo STORE também grava em Mem[5000]."""
+
+    def executar_instrucao(self, dec):
+        super().executar_instrucao(dec)
+        if dec['opcode'] == 17:
+            self.memoria.store(5000, 1)
+
+
+def test_escrita_em_endereco_inesperado(programa_bin):
+    cosim = CoSimulador(Processador(programa_bin, verbose=False),
+                        ProcessadorEscritaExtra(programa_bin, verbose=False), modo="bloco")
+    div = cosim.executar()
+
+    assert div.passo == 4
+    assert div.diferencas == ["Mem[5000]: ref=0 cand=1"]
+
+
+def test_modo_invalido():
+    with pytest.raises(ValueError):
+        CoSimulador(Processador(verbose=False), Processador(verbose=False), modo="ciclo")
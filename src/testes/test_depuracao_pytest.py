@@ -0,0 +1,152 @@
+import sys
+import os
+import pytest
+
+# Garante que a pasta `src` esteja no caminho de import
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from simulador.processador.processador_main import Processador
+from simulador.processador.cache import CacheL1
+from simulador.processador.depuracao import Depurador, CacheVigiada
+from simulador.processador.amostragem import ConfigAmostragem
+from simulador.processador.eventos import Escalonador, Barramento
+
+# Escreve r1 = 0..4 em Mem[100] e lê de volta em r4
+PROGRAMA = """
+lcl_lsb r1, 0       ; 0  contador
+lcl_lsb r2, 5       ; 1  limite
+lcl_lsb r3, 100     ; 2  endereço vigiado
+store r3, r1        ; 3  Mem[100] = r1 (início do laço)
+load r4, r3         ; 4  r4 = Mem[100]
+add r5, r5, r4      ; 5
+inc r1, r1          ; 6
+bne r1, r2, 3       ; 7
+halt                ; 8
+"""
+
+
+@pytest.fixture
+def programa_bin(montar):
+    return montar(PROGRAMA, "depuracao")
+
+
+@pytest.fixture(params=[False, True], ids=["simples", "fusao"])
+def cpu(request, programa_bin):
+    return Processador(programa_bin, verbose=False, fusao=request.param)
+
+
+def test_breakpoint_para_antes_da_instrucao_e_retoma(cpu):
+    depurador = Depurador(cpu)
+    depurador.adicionar_breakpoint(6)
+
+    parada = cpu.executar_programa()
+    assert parada.motivo == "breakpoint" and parada.pc == 6
+    assert parada.registradores[1] == 0          # o inc ainda não executou
+    assert cpu._pc_get() == 6
+
+    # Retomar executa a instrução do breakpoint e para na próxima volta do laço
+    parada = cpu.executar_programa()
+    assert parada.pc == 6 and parada.registradores[1] == 1
+    assert parada.instrucoes == 5                # 6, 7, 3, 4, 5
+
+    depurador.remover_breakpoint(6)
+    assert cpu.executar_programa() is None
+    assert cpu.parado and cpu.registradores.load(5) == 10
+
+
+def test_breakpoint_condicional(cpu):
+    depurador = Depurador(cpu)
+    depurador.adicionar_breakpoint(3, condicao=(1, '==', 3))
+    parada = cpu.executar_programa()
+    assert parada.pc == 3 and parada.registradores[1] == 3
+    assert cpu.memoria.load(100) == 2
+
+
+def test_watchpoint_de_escrita(cpu):
+    depurador = Depurador(cpu)
+    depurador.adicionar_watchpoint(100)
+
+    parada = cpu.executar_programa()
+    assert parada.motivo == "escrita" and parada.pc == 3
+    assert (parada.endereco, parada.valor) == (100, 0)
+    assert cpu._pc_get() == 4                    # o store já executou
+
+    cpu.executar_programa()
+    parada = cpu.executar_programa()
+    assert (parada.anterior, parada.valor) == (1, 2)
+
+
+def test_watchpoint_de_leitura_nao_funde_o_load(cpu):
+    depurador = Depurador(cpu)
+    depurador.adicionar_watchpoint(90, 110, leitura=True, escrita=False)
+
+    parada = cpu.executar_programa()
+    assert parada.motivo == "leitura" and parada.pc == 4
+    assert cpu._pc_get() == 5                    # o add do par load_alu não executou junto
+    assert cpu.registradores.load(5) == 0
+
+
+def test_vigia_so_existe_com_watchpoints(cpu):
+    depurador = Depurador(cpu)
+    depurador.adicionar_breakpoint(3)
+    assert isinstance(cpu.cache_dados, CacheL1)
+
+    depurador.adicionar_watchpoint(100)
+    assert isinstance(cpu.cache_dados, CacheVigiada)
+    assert cpu.cache_dados.hits == 0             # atributos da cache continuam acessíveis
+
+    depurador.remover_watchpoint(100)
+    assert isinstance(cpu.cache_dados, CacheL1)
+    assert not any(depurador.mapa)
+
+    depurador.desanexar()
+    assert cpu.depurador is None
+    assert cpu.executar_programa() is None and cpu.parado
+
+
+def test_vigia_debaixo_do_barramento(cpu):
+    # Depurador anexado antes do Escalonador: o Barramento envolve o vigia
+    depurador = Depurador(cpu)
+    depurador.adicionar_watchpoint(100)
+    escalonador = Escalonador(cpu)
+    depurador.adicionar_watchpoint(101)
+    assert isinstance(cpu.cache_dados, Barramento)
+    assert isinstance(escalonador.barramento.cache, CacheVigiada)
+    assert isinstance(escalonador.barramento.cache.cache, CacheL1)     # não envolve duas vezes
+
+    parada = cpu.executar_programa()
+    assert parada.motivo == "escrita" and parada.endereco == 100
+
+    depurador.remover_watchpoint(100)
+    depurador.remover_watchpoint(101)
+    assert cpu.cache_dados is escalonador.barramento
+    assert isinstance(escalonador.barramento.cache, CacheL1)
+
+
+def test_remover_watchpoint_preserva_sobrepostos(cpu):
+    depurador = Depurador(cpu)
+    depurador.adicionar_watchpoint(0, 200)
+    depurador.adicionar_watchpoint(100)
+    depurador.remover_watchpoint(0, 200)
+    assert depurador.mapa[100] and not depurador.mapa[99]
+
+
+@pytest.mark.parametrize("chamada", [
+    lambda d: d.adicionar_breakpoint(3, condicao=(40, '==', 1)),
+    lambda d: d.adicionar_breakpoint(3, condicao=(1, '=~', 1)),
+    lambda d: d.adicionar_watchpoint(10, 5),
+    lambda d: d.adicionar_watchpoint(70000),
+    lambda d: d.adicionar_watchpoint(10, escrita=False),
+])
+def test_parametros_invalidos(cpu, chamada):
+    with pytest.raises(ValueError):
+        chamada(Depurador(cpu))
+
+
+def test_amostragem_com_depurador_e_rejeitada(cpu):
+    depurador = Depurador(cpu)
+    depurador.adicionar_breakpoint(2)
+    depurador.adicionar_watchpoint(100)
+    with pytest.raises(ValueError):
+        cpu.executar_programa(amostragem=ConfigAmostragem(periodo=100, janela=10, aquecimento=0))
+    assert cpu._pc_get() == 0 and isinstance(cpu.cache_dados, CacheVigiada)
@@ -0,0 +1,248 @@
+import sys
+import os
+import heapq
+import pytest
+
+# Garante que a pasta `src` esteja no caminho de import
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from simulador.processador.processador_main import Processador
+from simulador.processador.depuracao import Depurador
+from simulador.processador.eventos import (Escalonador, Temporizador, PortaES,
+                                           BASE_TEMPORIZADOR, BASE_PORTA)
+from simulador.processador.amostragem import ConfigAmostragem
+from simulador.cosimulacao import CoSimulador
+
+# Temporizador periódico (100) com interrupção; o tratador conta em r20 e o programa para na 5ª
+PROGRAMA_TEMPORIZADOR = """
+j 9                 ; 0  pula o tratador
+inc r20, r20        ; 1  tratador: conta a interrupção
+lcl_lsb r29, 65298  ; 2  STATUS do temporizador (0xFF12)
+store r29, r0       ; 3  reconhece o temporizador
+lcl_lsb r29, 65281  ; 4  PENDENTES do controlador (0xFF01)
+store r29, r27      ; 5  limpa a linha 0
+lcl_lsb r29, 65280  ; 6  HABILITA (0xFF00)
+store r29, r27      ; 7  reabilita: só vale depois do jr
+jr r30              ; 8
+lcl_lsb r27, 1      ; 9  programa principal
+lcl_lsb r1, 65282   ; 10 VETOR = 1
+store r1, r27       ; 11
+lcl_lsb r1, 65297   ; 12 PERIODO = 100 (0xFF11)
+lcl_lsb r2, 100     ; 13
+store r1, r2        ; 14
+lcl_lsb r1, 65296   ; 15 CONTROLE = liga | periódico | interrupção (0xFF10)
+lcl_lsb r2, 7       ; 16
+store r1, r2        ; 17
+lcl_lsb r1, 65280   ; 18 habilita interrupções
+store r1, r27       ; 19
+lcl_lsb r3, 5       ; 20
+inc r5, r5          ; 21 trabalho
+blt r20, r3, 21     ; 22
+halt                ; 23
+"""
+
+# Espera ativa na porta de E/S até o "mundo externo" escrever um valor
+PROGRAMA_ESPERA = """
+lcl_lsb r1, 65312   ; 0  PORTA[0] (0xFF20)
+load r2, r1         ; 1  espera: lê a porta
+beq r2, r0, 1       ; 2  enquanto for zero
+lcl_lsb r3, 500     ; 3
+store r3, r2        ; 4  Mem[500] = valor lido
+halt                ; 5
+"""
+
+# Espera ativa lendo o tempo (CONTAGEM do temporizador) até t >= 50; r1 é zerado antes de
+# voltar, então os registradores na cabeça do laço são sempre iguais
+PROGRAMA_CONTAGEM = """
+lcl_lsb r2, 65299   ; 0  CONTAGEM do temporizador (0xFF13)
+lcl_lsb r3, 50      ; 1
+zeros r1            ; 2
+load r1, r2         ; 3  laço: lê o tempo
+blt r1, r3, 6       ; 4  ainda antes de t=50
+halt                ; 5
+zeros r1            ; 6
+j 3                 ; 7
+"""
+
+
+def preparar_espera(caminho, quando, detectar_ociosidade=True):
+    cpu = Processador(caminho, verbose=False)
+    escalonador = Escalonador(cpu, detectar_ociosidade=detectar_ociosidade)
+    porta = escalonador.conectar(PortaES(), BASE_PORTA)
+    escalonador.agendar(quando, lambda: porta.definir(0, 42))
+    return cpu, escalonador
+
+
+def test_interrupcoes_do_temporizador(montar):
+    cpu = Processador(montar(PROGRAMA_TEMPORIZADOR), verbose=False)
+    escalonador = Escalonador(cpu)
+    temporizador = escalonador.conectar(Temporizador(linha=0), BASE_TEMPORIZADOR)
+
+    escalonador.executar(max_tempo=10000)
+    assert cpu.parado
+    assert cpu.registradores.load(20) == 5
+    assert escalonador.interrupcoes == 5 and temporizador.expiracoes == 5
+    # Cada interrupção chega ~100 unidades depois da anterior
+    assert 500 <= escalonador.tempo < 600
+    assert escalonador.instrucoes_puladas == 0      # o laço principal trabalha (r5 muda)
+
+
+class MotorEscalonado:
+    """Motor de co-simulação em que cada passo passa pelo escalonador (eventos e interrupções)."""
+
+    def __init__(self, escalonador):
+        self.escalonador = escalonador
+        self.cpu = escalonador.cpu
+        self.registradores, self.pc = self.cpu.registradores, self.cpu.pc
+        self.flags, self.memoria = self.cpu.flags, self.cpu.memoria
+
+    @property
+    def parado(self):
+        return self.cpu.parado
+
+    @parado.setter
+    def parado(self, valor):
+        self.cpu.parado = valor
+
+    def executar_passo(self):
+        return self.escalonador.executar_passo()
+
+
+@pytest.mark.parametrize("periodo", [37, 101])
+def test_fusao_com_interrupcoes_igual_a_referencia(montar, periodo):
+    # Período ímpar: eventos vencem no meio de pares fundíveis (inc + blt do laço principal)
+    texto = PROGRAMA_TEMPORIZADOR.replace("lcl_lsb r2, 100 ", f"lcl_lsb r2, {periodo} ")
+    caminho = montar(texto, f"temporizador{periodo}")
+    motores = []
+    for fusao in (False, True):
+        cpu = Processador(caminho, verbose=False, fusao=fusao)
+        escalonador = Escalonador(cpu)
+        escalonador.conectar(Temporizador(linha=0), BASE_TEMPORIZADOR)
+        motores.append(MotorEscalonado(escalonador))
+
+    assert CoSimulador(*motores).executar() is None
+    referencia, fundido = motores
+    assert fundido.cpu.parado and fundido.cpu.fusor.pares_executados > 0
+    assert fundido.escalonador.tempo == referencia.escalonador.tempo
+    assert fundido.escalonador.interrupcoes == referencia.escalonador.interrupcoes == 5
+
+
+def test_laco_ocioso_pula_ate_o_evento(montar):
+    cpu, escalonador = preparar_espera(montar(PROGRAMA_ESPERA), 1_000_000)
+    escalonador.executar(max_tempo=2_000_000)
+
+    assert cpu.parado and cpu.memoria.load(500) == 42
+    assert escalonador.tempo > 1_000_000
+    assert escalonador.instrucoes < 50
+    assert escalonador.lacos_ociosos == 1
+
+
+def test_pular_laco_ocioso_nao_muda_o_resultado(montar):
+    caminho = montar(PROGRAMA_ESPERA)
+    cpu_a, rapido = preparar_espera(caminho, 3001)
+    cpu_b, lento = preparar_espera(caminho, 3001, detectar_ociosidade=False)
+    rapido.executar(max_tempo=10000)
+    lento.executar(max_tempo=10000)
+
+    assert rapido.tempo == lento.tempo
+    assert rapido.instrucoes + rapido.instrucoes_puladas == lento.instrucoes
+    assert cpu_a.registradores.regs == cpu_b.registradores.regs
+    assert cpu_a._pc_get() == cpu_b._pc_get()
+
+
+def test_leitura_volatil_impede_pular_laco(montar):
+    caminho = montar(PROGRAMA_CONTAGEM)
+    resultados = []
+    for detectar in (True, False):
+        cpu = Processador(caminho, verbose=False)
+        escalonador = Escalonador(cpu, detectar_ociosidade=detectar)
+        escalonador.conectar(Temporizador(), BASE_TEMPORIZADOR)
+        escalonador.executar(max_tempo=10000)
+        assert cpu.parado
+        resultados.append((escalonador.tempo, escalonador.instrucoes_puladas))
+    assert resultados[0] == resultados[1] == (54, 0)
+
+
+def test_laco_ocioso_sem_eventos_vai_ao_limite(montar):
+    cpu, escalonador = preparar_espera(montar(PROGRAMA_ESPERA), 10 ** 9)
+    escalonador.executar(max_tempo=10 ** 6)
+    assert not cpu.parado
+    assert escalonador.tempo == 10 ** 6
+    assert escalonador.instrucoes < 50
+
+
+def test_reprogramar_temporizador_cancela_evento_antigo():
+    cpu = Processador(verbose=False)
+    escalonador = Escalonador(cpu)
+    temporizador = escalonador.conectar(Temporizador(), BASE_TEMPORIZADOR)
+    temporizador.escrever(Temporizador.PERIODO, 10)
+    temporizador.escrever(Temporizador.CONTROLE, Temporizador.LIGADO)
+    temporizador.escrever(Temporizador.PERIODO, 50)    # reprograma: a expiração em t=10 é descartada
+
+    while escalonador.fila:
+        tempo, _, acao = heapq.heappop(escalonador.fila)
+        escalonador.tempo = tempo
+        acao()
+    assert temporizador.expiracoes == 1 and escalonador.tempo == 50
+    assert temporizador.ler(Temporizador.STATUS) == 1
+
+
+def test_store_e_load_mapeados():
+    cpu = Processador(verbose=False)
+    escalonador = Escalonador(cpu)
+    porta = escalonador.conectar(PortaES(quantidade=2), BASE_PORTA)
+
+    cpu.cache_dados.store(BASE_PORTA + 1, 0x1_0000_0007)
+    assert porta.saidas == [(0, 1, 7)]
+    assert cpu.cache_dados.load(BASE_PORTA + 1) == 7
+    assert cpu.memoria.load(BASE_PORTA + 1) == 0           # a RAM não é tocada
+    assert cpu.cache_dados.hits == 0 and cpu.cache_dados.misses == 0
+
+
+def test_conectar_invalido():
+    escalonador = Escalonador(Processador(verbose=False))
+    escalonador.conectar(PortaES(), BASE_PORTA)
+    with pytest.raises(ValueError):
+        escalonador.conectar(Temporizador(), BASE_PORTA + 2)    # sobrepõe a porta
+    with pytest.raises(ValueError):
+        escalonador.conectar(PortaES(), 65534)                  # passa do fim da memória
+    with pytest.raises(ValueError):
+        escalonador.agendar(-1, lambda: None)
+
+
+def test_executar_programa_usa_o_escalonador(montar, capsys):
+    cpu, escalonador = preparar_espera(montar(PROGRAMA_ESPERA), 5000)
+    cpu.executar_programa(max_ciclos=10000)
+    assert cpu.parado
+    assert "Escalonador - Tempo:" in capsys.readouterr().out
+
+
+def test_escalonador_respeita_o_depurador(montar, capsys):
+    cpu, escalonador = preparar_espera(montar(PROGRAMA_ESPERA), 5000)
+    depurador = Depurador(cpu)
+    depurador.adicionar_breakpoint(3)
+    depurador.adicionar_watchpoint(500)
+
+    parada = cpu.executar_programa(max_ciclos=10000)
+    assert parada.motivo == "breakpoint" and parada.pc == 3
+    assert escalonador.tempo >= 5000                # o laço ocioso foi pulado antes da parada
+
+    parada = cpu.executar_programa(max_ciclos=10000)
+    assert parada.motivo == "escrita" and (parada.endereco, parada.valor) == (500, 42)
+    assert cpu.executar_programa(max_ciclos=10000) is None and cpu.parado
+
+
+def test_erro_de_execucao_com_escalonador(montar, capsys):
+    # load de um endereço além da memória: o erro é relatado, sem exceção
+    texto = "lcl_msb r1, 1\nload r2, r1\nhalt\n"
+    cpu = Processador(montar(texto, "erro"), verbose=False)
+    Escalonador(cpu)
+    assert cpu.executar_programa() is None
+    assert "✗ Erro na execução" in capsys.readouterr().out
+
+
+def test_amostragem_com_escalonador_e_rejeitada(montar):
+    cpu, escalonador = preparar_espera(montar(PROGRAMA_ESPERA), 50)
+    with pytest.raises(ValueError):
+        cpu.executar_programa(max_ciclos=10000, amostragem=ConfigAmostragem())
+    assert escalonador.tempo == 0 and cpu.cache_dados is escalonador.barramento
@@ -0,0 +1,159 @@
+import sys
+import os
+import pytest
+
+# Garante que a pasta `src` esteja no caminho de import
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from interpretador.interpretador import montar_instrucao
+from simulador.processador.processador_main import Processador
+from simulador.processador.fusao import FusorInstrucoes, classificar_par
+from simulador.cosimulacao import CoSimulador
+
+# Soma Mem[200..209] em r4, usando os três idiomas fundíveis
+PROGRAMA_SOMA = """
+lcl_msb r1, 0       ; 0  r1 = 200 (ponteiro) -> par "constante"
+lcl_lsb r1, 200     ; 1
+lcl_lsb r2, 210     ; 2  fim do vetor
+lcl_lsb r5, 3       ; 3
+store r1, r5        ; 4  Mem[r1] = 3 (início do laço de preenchimento)
+inc r1, r1          ; 5  -> par "laco"
+bne r1, r2, 4       ; 6
+lcl_lsb r1, 200     ; 7
+zeros r4            ; 8
+load r3, r1         ; 9  -> par "load_alu" (início do laço de soma)
+add r4, r4, r3      ; 10
+inc r1, r1          ; 11 -> par "laco"
+blt r1, r2, 9       ; 12
+halt                ; 13
+"""
+
+# Desvio que cai na segunda instrução de um par
+PROGRAMA_MEIO_DO_PAR = """
+lcl_lsb r2, 3       ; 0
+zeros r5            ; 1
+j 4                 ; 2  pula para o meio do par (3, 4)
+lcl_msb r1, 1       ; 3
+lcl_lsb r1, 7       ; 4
+inc r5, r5          ; 5
+bne r5, r2, 3       ; 6
+halt                ; 7
+"""
+
+# Programa que reescreve a segunda instrução de um par (lcl_lsb r1, 7 -> lcl_lsb r1, 9) antes
+# de ela ser buscada pela primeira vez: a cache de instruções ainda não tem a palavra antiga
+PROGRAMA_AUTOMODIFICAVEL = """
+lcl_msb r6, 3840    ; 0  r6 = 0x0F000901 = "lcl_lsb r1, 9"
+lcl_lsb r6, 2305    ; 1
+lcl_lsb r7, 6       ; 2  endereço da segunda instrução do par
+store r7, r6        ; 3
+zeros r5            ; 4
+lcl_msb r1, 1       ; 5
+lcl_lsb r1, 7       ; 6  já é "lcl_lsb r1, 9" quando é buscada
+halt                ; 7
+"""
+
+
+class FusorConstanteErrada(FusorInstrucoes):
+    """Fusor com defeito: o par "constante" soma 1 ao valor montado."""
+
+    def _constante(self, cpu, campos1, campos2):
+        super()._constante(cpu, campos1, campos2)
+        rc = campos1[3]
+        cpu.registradores.read(rc, cpu.registradores.load(rc) + 1)
+
+
+def _palavra(linha):
+    return int(montar_instrucao(linha), 2)
+
+
+def test_classificar_par():
+    assert classificar_par(_palavra("lcl_msb r1, 1"), _palavra("lcl_lsb r1, 2")) == "constante"
+    assert classificar_par(_palavra("lcl_lsb r1, 2"), _palavra("lcl_msb r1, 1")) == "constante"
+    assert classificar_par(_palavra("lcl_msb r1, 1"), _palavra("lcl_lsb r2, 2")) is None
+    assert classificar_par(_palavra("dec r1, r1"), _palavra("bne r1, r0, 4")) == "laco"
+    assert classificar_par(_palavra("load r3, r1"), _palavra("add r4, r4, r3")) == "load_alu"
+    assert classificar_par(_palavra("load r3, r1"), _palavra("mul r4, r4, r3")) is None
+    assert classificar_par(_palavra("add r1, r2, r3"), _palavra("bne r1, r0, 4")) is None
+
+
+@pytest.mark.parametrize("programa", [PROGRAMA_SOMA, PROGRAMA_MEIO_DO_PAR, PROGRAMA_AUTOMODIFICAVEL])
+def test_fusao_equivale_ao_interpretador(montar, programa):
+    caminho = montar(programa)
+    cosim = CoSimulador(Processador(caminho, verbose=False),
+                        Processador(caminho, verbose=False, fusao=True))
+    assert cosim.executar() is None
+    assert cosim.candidato.fusor.pares_executados > 0
+
+
+def test_contagem_de_instrucoes_fundidas(montar):
+    cpu = Processador(montar(PROGRAMA_SOMA), verbose=False, fusao=True)
+    cpu.executar_programa()
+
+    assert cpu.registradores.load(4) == 30
+    assert cpu.fusor.por_tipo == {"constante": 1, "laco": 20, "load_alu": 10}
+    assert cpu.fusor.instrucoes_fundidas == 62
+
+
+def test_executar_silencioso_conta_as_instrucoes_do_par(montar):
+    caminho = montar(PROGRAMA_SOMA)
+    referencia = Processador(caminho, verbose=False)
+    fundido = Processador(caminho, verbose=False, fusao=True)
+    contagem_ref, contagem_fusao = {}, {}
+
+    assert fundido.executar_silencioso(10000, contagem_fusao) == referencia.executar_silencioso(10000, contagem_ref)
+    assert fundido.parado and contagem_fusao == contagem_ref
+    assert Processador(caminho, verbose=False, fusao=True).executar_silencioso(1) == 2  # o par não é partido
+
+
+def test_desvio_para_segunda_instrucao_do_par(montar):
+    cpu = Processador(montar(PROGRAMA_MEIO_DO_PAR), verbose=False, fusao=True)
+    cpu.executar_programa()
+
+    assert cpu.registradores.load(1) == 0x00010007
+    # A primeira passagem entra pelo meio do par; as duas seguintes executam o par fundido
+    assert cpu.fusor.por_tipo["constante"] == 2
+
+
+def test_par_pre_decodificado_e_reescrito_pelo_programa(montar, monkeypatch):
+    caminho = montar(PROGRAMA_AUTOMODIFICAVEL)
+    referencia = Processador(caminho, verbose=False)
+    candidato = Processador(caminho, verbose=False, fusao=True)
+    # Pré-decodificado com a palavra antiga (como no pré-aquecimento pelo CFG)
+    candidato.fusor.pre_decodificar(candidato.memoria, range(8))
+
+    decodificados = []
+    original = candidato.fusor._decodificar_par
+    monkeypatch.setattr(candidato.fusor, "_decodificar_par",
+                        lambda p1, p2: decodificados.append((p1, p2)) or original(p1, p2))
+    assert CoSimulador(referencia, candidato).executar() is None
+
+    nova = _palavra("lcl_lsb r1, 9")
+    assert decodificados == [(_palavra("lcl_msb r1, 1"), nova)]     # só o par reescrito
+    assert candidato.registradores.load(1) == referencia.registradores.load(1) == 0x00010009
+
+
+def test_par_modificado_e_decodificado_de_novo(montar):
+    cpu = Processador(montar(PROGRAMA_MEIO_DO_PAR), verbose=False, fusao=True)
+    cpu.executar_programa()
+
+    # Reescreve a segunda palavra do par e descarta a cache de instruções
+    cpu.memoria.store(4, _palavra("lcl_lsb r1, 9"))
+    cpu.cache_instrucoes.linhas.clear()
+    cpu.registradores.read(5, 0)
+    cpu._pc_set(3)
+    cpu.parado = False
+    cpu.executar_programa()
+
+    assert cpu.registradores.load(1) == 0x00010009
+
+
+def test_cosimulacao_detecta_par_fundido_errado(montar):
+    caminho = montar(PROGRAMA_SOMA)
+    candidato = Processador(caminho, verbose=False, fusao=True)
+    candidato.fusor = FusorConstanteErrada()
+    div = CoSimulador(Processador(caminho, verbose=False), candidato, modo="hash", intervalo=50).executar()
+
+    assert div.passo == 1
+    assert div.desmontagem == "lcl_msb r1, 0"
+    assert "R1: ref=200 (0xC8) cand=201 (0xC9)" in div.diferencas
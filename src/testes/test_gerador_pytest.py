@@ -0,0 +1,92 @@
+import sys
+import os
+import pytest
+
+# Garante que a pasta `src` esteja no caminho de import
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from interpretador.gerador import GeradorProgramas, gerar_programa, LIMITE_DESVIO
+from simulador.processador.processador_main import Processador
+from simulador.cosimulacao import CoSimulador
+
+
+def executar(caminho_bin, max_ciclos=10 ** 6):
+    cpu = Processador(caminho_bin, verbose=False)
+    return cpu, cpu.executar_silencioso(max_ciclos)
+
+
+def test_mesma_semente_mesmo_programa(tmp_path):
+    assert gerar_programa(42).texto == gerar_programa(42).texto
+    assert gerar_programa(42).texto != gerar_programa(43).texto
+    programa = gerar_programa(42)
+    programa.salvar(str(tmp_path / "gerado.asm"))
+    assert (tmp_path / "gerado.asm").read_text() == programa.texto
+
+
+def test_programa_termina_dentro_do_limite(montar):
+    for semente in range(5):
+        programa = gerar_programa(semente)
+        cpu, instrucoes = executar(montar(programa.texto, f"p{semente}"))
+        assert cpu.parado
+        assert instrucoes <= programa.instrucoes_dinamicas_max
+
+
+def test_mix_apenas_alu(montar):
+    programa = gerar_programa(1, mix={'alu': 1}, profundidade_lacos=0, profundidade_chamadas=0)
+    for linha in programa.texto.splitlines():
+        assert not linha.strip().startswith(("load", "store", "jal", "mul"))
+    cpu, _ = executar(montar(programa.texto))
+    assert cpu.parado
+
+
+def test_programa_grande_usa_trampolins(montar):
+    # Acima de 256 instruções, desvios condicionais passam por trampolins no início da memória
+    programa = gerar_programa(3, tamanho_bloco=150, iteracoes=(20, 40), profundidade_lacos=1)
+    assert programa.instrucoes_estaticas > LIMITE_DESVIO
+    caminho = montar(programa.texto)
+
+    for linha in programa.texto.splitlines():
+        partes = linha.split(";")[0].replace(",", " ").split()
+        if partes and partes[0] in ("beq", "bne", "bgt", "blt"):
+            assert int(partes[-1]) < LIMITE_DESVIO
+
+    cpu, instrucoes = executar(caminho)
+    assert cpu.parado
+    assert instrucoes <= programa.instrucoes_dinamicas_max
+
+
+def test_limite_dinamico_conta_os_trampolins(montar):
+    # Laço longo só com ALU: cada `bne` tomado passa pelo seu trampolim (um `j` a mais)
+    programa = gerar_programa(0, mix={'alu': 1}, tamanho_bloco=300, iteracoes=(50, 60),
+                              profundidade_lacos=1, profundidade_chamadas=0)
+    cpu, instrucoes = executar(montar(programa.texto))
+    assert cpu.parado
+    assert instrucoes <= programa.instrucoes_dinamicas_max
+
+
+def test_alvo_instrucoes():
+    pequeno = gerar_programa(7)
+    grande = gerar_programa(7, alvo_instrucoes=1_000_000)
+    assert grande.instrucoes_dinamicas_max >= 1_000_000
+    # O laço externo repete o corpo, sem multiplicar o código estático
+    assert grande.instrucoes_estaticas < 2 * pequeno.instrucoes_estaticas + 16
+
+
+@pytest.mark.parametrize("parametros", [
+    {'profundidade_lacos': 4},
+    {'footprint': 100},
+    {'iteracoes': (5, 2)},
+    {'mix': {'vetorial': 1}},
+])
+def test_parametros_invalidos(parametros):
+    with pytest.raises(ValueError):
+        GeradorProgramas(0, **parametros)
+
+
+def test_fuzz_cosimulacao_com_fusao(montar):
+    for semente in range(3):
+        caminho = montar(gerar_programa(semente).texto, f"f{semente}")
+        referencia = Processador(caminho, verbose=False)
+        candidato = Processador(caminho, verbose=False, fusao=True)
+        assert CoSimulador(referencia, candidato, modo="hash", intervalo=50).executar() is None
+        assert referencia.parado
@@ -0,0 +1,130 @@
+import sys
+import os
+import subprocess
+import time
+import pytest
+
+# Garante que a pasta `src` esteja no caminho de import
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import main
+
+MAIN = os.path.join(os.path.dirname(main.__file__), "main.py")
+
+# Orçamento de inicialização: tempo extra de `main.py --help` sobre um interpretador vazio
+ORCAMENTO_INICIALIZACAO_S = 0.25
+
+PROGRAMA = """
+lcl_lsb r1, 3
+inc r1, r1
+halt
+"""
+
+
+def _tempo_minimo(comando, repeticoes=3):
+    melhor = float("inf")
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        subprocess.run(comando, check=True, capture_output=True)
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor
+
+
+def _modulos_importados(*args):
+    """Módulos do projeto importados por `main.py <args>` (via -X importtime)."""
+    res = subprocess.run([sys.executable, "-X", "importtime", MAIN, *args],
+                         capture_output=True, text=True, check=True)
+    modulos = [linha.split("|")[-1].strip() for linha in res.stderr.splitlines() if "|" in linha]
+    return {m for m in modulos if m.startswith(("simulador", "interpretador"))}
+
+
+def test_orcamento_de_inicializacao():
+    vazio = _tempo_minimo([sys.executable, "-c", "pass"])
+    ajuda = _tempo_minimo([sys.executable, MAIN, "--help"])
+    assert ajuda - vazio < ORCAMENTO_INICIALIZACAO_S
+
+
+def test_importacoes_sob_demanda(tmp_path):
+    assert _modulos_importados("--help") == set()
+
+    asm = tmp_path / "p.asm"
+    asm.write_text(PROGRAMA)
+    assert _modulos_importados("assemble", str(asm)) == {"interpretador", "interpretador.interpretador"}
+
+    # Executar não deve carregar módulos opcionais (amostragem, fusão, co-simulação)
+    importados = _modulos_importados("run", "-q", str(asm))
+    assert "simulador.processador.processador_main" in importados
+    assert not importados & {"simulador.processador.amostragem", "simulador.processador.fusao",
+                             "simulador.cosimulacao"}
+
+
+def test_run_nao_remonta_binario_atualizado(tmp_path):
+    asm = tmp_path / "p.asm"
+    asm.write_text(PROGRAMA)
+    caminho_bin = main._montar_se_necessario(str(asm))
+    assert caminho_bin == str(tmp_path / "p.bin")
+
+    modificado = os.path.getmtime(caminho_bin)
+    assert main._montar_se_necessario(str(asm)) == caminho_bin
+    assert os.path.getmtime(caminho_bin) == modificado
+
+
+def test_stats_mostra_mix_de_instrucoes(tmp_path, capsys):
+    asm = tmp_path / "p.asm"
+    asm.write_text(PROGRAMA)
+    main.main(["stats", str(asm)])
+
+    saida = capsys.readouterr().out
+    assert "Instruções executadas: 3" in saida
+    assert "lcl_lsb" in saida and "inc" in saida and "halt" in saida
+
+
+def test_stats_com_fusao_conta_as_duas_instrucoes_do_par(tmp_path, capsys):
+    asm = tmp_path / "laco.asm"
+    asm.write_text("lcl_lsb r1, 10\ndec r1, r1\nbne r1, r0, 1\nhalt\n")
+    main.main(["stats", str(asm), "--fusao"])
+
+    mix = {}
+    for linha in capsys.readouterr().out.split("--- Mix de Instruções ---")[1].split("---")[0].splitlines():
+        if linha.strip():
+            nome, n = linha.split()[:2]
+            mix[nome] = int(n)
+    assert mix == {"lcl_lsb": 1, "dec": 10, "bne": 10, "halt": 1}
+
+
+def test_run_rejeita_amostragem_com_eventos(tmp_path, capsys):
+    asm = tmp_path / "p.asm"
+    asm.write_text(PROGRAMA)
+    with pytest.raises(SystemExit) as saida:
+        main.main(["run", str(asm), "--eventos", "--amostragem"])
+    assert saida.value.code == 2
+    assert "--amostragem não pode ser combinada com --eventos" in capsys.readouterr().err
+
+
+def test_run_rejeita_amostragem_com_breakpoint(tmp_path, capsys):
+    asm = tmp_path / "p.asm"
+    asm.write_text(PROGRAMA)
+    for opcao in ("-b", "-w"):
+        with pytest.raises(SystemExit) as saida:
+            main.main(["run", str(asm), opcao, "2", "--amostragem"])
+        assert saida.value.code == 2
+    assert "--amostragem não pode ser combinada com -b/--breakpoint" in capsys.readouterr().err
+
+
+def test_montagem_com_erro_nao_deixa_binario(tmp_path, capsys):
+    asm = tmp_path / "erro.asm"
+    asm.write_text("lcl_lsb r1, 3\nfoo r1, r1\nhalt\n")
+    for comando in (["assemble", str(asm)], ["run", str(asm)], ["run", str(asm)]):
+        with pytest.raises(SystemExit) as saida:
+            main.main(comando)
+        assert saida.value.code == 1
+        assert not (tmp_path / "erro.bin").exists()
+    assert "✗ Falha ao montar" in capsys.readouterr().err
+
+
+def test_prefetch_relata_erro_de_execucao(tmp_path, capsys):
+    # load de um endereço além da memória
+    asm = tmp_path / "erro.asm"
+    asm.write_text("lcl_msb r1, 1\nload r2, r1\nhalt\n")
+    main.main(["prefetch", str(asm)])
+    assert "✗ Erro na execução" in capsys.readouterr().out
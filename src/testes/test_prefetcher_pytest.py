@@ -0,0 +1,133 @@
+import sys
+import os
+import pytest
+
+# Garante que a pasta `src` esteja no caminho de import
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from interpretador.gerador import gerar_programa
+from simulador.processador.memoria import Memoria
+from simulador.processador.cache import CacheL1
+from simulador.processador.processador_main import Processador
+from simulador.processador.prefetcher import (PrefetcherProximaLinha, PrefetcherStride,
+                                              PrefetcherStreamBuffers, criar_prefetcher,
+                                              comparar_prefetchers, formatar_comparacao)
+from simulador.cosimulacao import CoSimulador
+
+# Soma Mem[4096], Mem[4098], ... Mem[8190]: um load por iteração com passo 2
+PROGRAMA_PASSO_2 = """
+lcl_lsb r1, 4096    ; 0
+lcl_lsb r2, 8192    ; 1
+lcl_lsb r6, 2       ; 2
+load r3, r1         ; 3  (início do laço)
+add r4, r4, r3      ; 4
+add r1, r1, r6      ; 5
+blt r1, r2, 3       ; 6
+halt                ; 7
+"""
+
+
+class PrefetcherFixo:
+    """Prefetcher de teste: no primeiro miss, emite os endereços dados."""
+    nome = "fixo"
+
+    def __init__(self, alvos):
+        self.alvos = alvos
+
+    def observar(self, endereco, pc, evento):
+        alvos, self.alvos = self.alvos, []
+        return alvos if evento == "miss" else []
+
+
+def test_contadores_util_atrasado_inutil():
+    memoria = Memoria()
+    for e in range(10):
+        memoria.store(e, e * 10)
+    cache = CacheL1(memoria, "L1", prefetcher=PrefetcherFixo([1, 2, 3, 70000]), latencia_prefetch=2)
+
+    assert cache.load(0) == 0           # miss: emite 1, 2 e 3 (70000 está fora da memória)
+    assert cache.prefetch_emitidos == 3
+    assert cache.load(1) == 10          # 2º acesso: ainda a caminho -> atrasado (miss)
+    assert cache.load(2) == 20          # 3º acesso: chegou -> útil (hit)
+    assert (cache.hits, cache.misses) == (1, 2)
+    assert (cache.prefetch_uteis, cache.prefetch_atrasados, cache.prefetch_inuteis) == (1, 1, 1)
+    assert "Úteis: 1, Atrasados: 1, Inúteis: 1" in cache.get_stats()
+
+
+def test_store_descarta_prefetch_pendente():
+    memoria = Memoria()
+    cache = CacheL1(memoria, "L1", prefetcher=PrefetcherFixo([5]), latencia_prefetch=0)
+    cache.load(0)
+    cache.store(5, 99)
+    assert 5 not in cache.pendentes
+    assert cache.load(5) == 99 and cache.prefetch_inuteis == 1
+
+
+def test_desligar_prefetcher_com_pendentes():
+    memoria = Memoria()
+    memoria.store(1, 10)
+    cache = CacheL1(memoria, "L1", prefetcher=PrefetcherFixo([1, 2]), latencia_prefetch=0)
+    cache.load(0)
+    cache.prefetcher = None
+    assert cache.load(1) == 10 and cache.prefetch_uteis == 1
+    assert 2 in cache.pendentes
+
+
+def test_prefetch_le_valor_atual_da_ram():
+    # O valor é lido na chegada do pedido: uma escrita direto na RAM depois da emissão é vista
+    memoria = Memoria()
+    cache = CacheL1(memoria, "L1", prefetcher=PrefetcherFixo([5]), latencia_prefetch=0)
+    cache.load(0)
+    memoria.store(5, 7)
+    assert cache.load(5) == 7 and cache.prefetch_uteis == 1
+
+
+def test_proxima_linha():
+    p = PrefetcherProximaLinha(grau=2)
+    assert list(p.observar(10, None, "miss")) == [11, 12]
+    assert list(p.observar(11, None, "util")) == [12, 13]
+    assert list(p.observar(11, None, "hit")) == []
+
+
+def test_stride_por_pc():
+    p = PrefetcherStride(grau=2)
+    assert list(p.observar(100, 7, "miss")) == []
+    assert list(p.observar(103, 7, "miss")) == []          # passo 3 visto uma vez
+    assert list(p.observar(500, 8, "miss")) == []          # outro PC não interfere
+    assert list(p.observar(106, 7, "miss")) == [109, 112]  # passo confirmado
+    assert list(p.observar(106, None, "miss")) == []       # sem PC não treina
+
+
+def test_stream_buffers():
+    p = PrefetcherStreamBuffers(buffers=2, profundidade=3)
+    assert list(p.observar(10, None, "miss")) == [11, 12, 13]
+    assert list(p.observar(11, None, "util")) == [14]        # avança o fluxo
+    assert list(p.observar(50, None, "miss")) == [51, 52, 53]
+    assert list(p.observar(90, None, "miss")) == [91, 92, 93]  # substitui o fluxo menos usado (10..)
+    assert list(p.observar(12, None, "util")) == [13, 14, 15]  # fluxo 10.. foi descartado: novo fluxo
+
+
+def test_criar_prefetcher():
+    assert isinstance(criar_prefetcher("stride", grau=3), PrefetcherStride)
+    with pytest.raises(ValueError):
+        criar_prefetcher("markov")
+
+
+def test_comparacao_passo_2(montar):
+    linhas = comparar_prefetchers(montar(PROGRAMA_PASSO_2), latencia=4)
+    dados = {l['prefetcher']: l for l in linhas if l['cache'] == "L1 Dados"}
+
+    assert dados['nenhum']['misses'] == 2048 and dados['nenhum']['reducao'] == 0.0
+    # Passo 2 com latência 4: só o stride antecipa o suficiente
+    assert dados['stride']['reducao'] > 0.99
+    assert dados['next-line']['atrasados'] > 2000
+    assert "stride" in formatar_comparacao(linhas)
+
+
+def test_prefetch_nao_altera_resultado(montar):
+    # Prefetch só muda hits/misses: o estado arquitetural tem de ser idêntico ao da referência
+    for semente, tipo in enumerate(["next-line", "stride", "stream"]):
+        caminho = montar(gerar_programa(semente).texto, f"g{semente}")
+        referencia = Processador(caminho, verbose=False)
+        candidato = Processador(caminho, verbose=False, fusao=True, prefetch=tipo)
+        assert CoSimulador(referencia, candidato, modo="hash", intervalo=50).executar() is None